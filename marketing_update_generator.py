@@ -11,19 +11,34 @@ Two versions:
 Uses HUB International branding with color-coded carrier comparison tables.
 """
 
+import io
+import math
 import os
+import sys
+import time
 import logging
 import tempfile
-from collections import defaultdict
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
+from functools import cached_property, lru_cache, wraps
+from itertools import groupby
+from operator import itemgetter
 
 import requests as http_requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Emu
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.table import Table
 from docx.oxml.ns import qn, nsdecls
-from docx.oxml import parse_xml
+from docx.oxml import OxmlElement, parse_xml
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +47,21 @@ AIRTABLE_PAT = os.environ.get("AIRTABLE_PAT", "")
 SALES_BASE_ID = os.environ.get("SALES_BASE_ID", "appnFKEzmdLbR4CHY")
 POLICIES_TABLE_ID = os.environ.get("SALES_POLICIES_TABLE_ID", "tbl8vZP2oHrinwVfd")
 OPPORTUNITIES_TABLE_ID = os.environ.get("OPPORTUNITIES_TABLE_ID", "tblMKuUsG1cosdQPN")
+COMPANIES_TABLE_ID = os.environ.get("COMPANIES_TABLE_ID", "tblMPEvjv6mcSwdSd")
+
+# Columns actually read from each table; requested via fields[] to keep payloads small
+POLICY_FIELDS = (
+    "Policy Type", "Insurance Company", "Status", "Base Premium", "Premium Tx",
+    "Commission", "Revenue", "Broker ABBR", "Direct", "Brokers", "Units", "# of Locs",
+    "TIV", "Property Rate", "Property Limit", "AOP", "Wind Type", "Wind", "AOW",
+    "Water Damage", "Flood Limit", "Flood Deductible", "EQ Limit", "Earthquake Deductible",
+    "Gross Sales", "GL Rate $", "GL Rate (u)", "GL Deductible", "UMB Limit",
+    "Total Payroll", "Exp Mod", "Safety", "Drug Free", "Comments",
+)
+OPPORTUNITY_FIELDS = (
+    "Opportunity Name", "Effective Date", "Opportunity Corporate Name", "Corporate Name", "Policies",
+)
+BROKER_FIELDS = ("ABBR", "Name", "Company Name")
 
 # ── HUB Colors ──
 ELECTRIC_BLUE = RGBColor(0x16, 0x7B, 0xD4)
@@ -42,6 +72,8 @@ WHITE = RGBColor(0xFF, 0xFF, 0xFF)
 CHARCOAL = RGBColor(0x4A, 0x4A, 0x4A)
 DARK_GREEN = RGBColor(0x1B, 0x7A, 0x3D)
 DARK_RED = RGBColor(0xC0, 0x39, 0x2B)
+PALE_BLUE = RGBColor(0xCC, 0xE5, 0xFF)
+MUTED_GRAY = RGBColor(0x88, 0x88, 0x88)
 
 ELECTRIC_BLUE_HEX = "167BD4"
 CLASSIC_BLUE_HEX = "263845"
@@ -54,8 +86,38 @@ PROPOSED_GREEN_HEX = "E8F5E9"
 EXPIRING_GRAY_HEX = "EDEFF1"
 PENDING_YELLOW_HEX = "FFF8E1"
 
+# Empty-value sentinel. Values produced in this module use this exact object,
+# so hot paths can test `v is not _DASH` instead of comparing strings.
+_DASH = sys.intern("\u2014")
+
+# ── Shared lengths ──
+# Pt/Inches values are immutable ints, so the common ones are built once and shared.
+_PT = {n: Pt(n) for n in range(37)}
+_PT[7.5] = Pt(7.5)
+_IN = {v: Inches(v) for v in (-0.3, 0.1, 0.25, 0.3, 0.6, 1.2, 1.8, 2.5, 4.5, 7)}
+
+
+def _pt(points):
+    """Pt(points), served from _PT for the sizes the layout uses."""
+    length = _PT.get(points)
+    return length if length is not None else Pt(points)
+
+
 LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "hub_logo.png")
 
+# ── Closing block (identical in every document) ──
+TEAM_CONTACTS = (
+    ("Stefan Burkey", "Hotel Franchise Practice Leader  |  stefan.burkey@hubinternational.com"),
+    ("Maureen Harvey", "Account Executive  |  maureen.harvey@hubinternational.com"),
+    ("Sheena Callazo", "Claims Advocate  |  sheena.callazo@hubinternational.com"),
+)
+
+DISCLAIMER_TEXT = (
+    "This marketing update is for informational purposes only and does not constitute a binder of insurance. "
+    "Actual coverage terms, conditions, and exclusions are governed by the policies as issued. "
+    "Please review all policies carefully upon receipt."
+)
+
 # ── Coverage ordering ──
 COVERAGE_ORDER = [
     "Property", "Liability", "Umbrella", "Workers Compensation",
@@ -95,6 +157,10 @@ COVERAGE_SHORT = {
     "Package": "Package",
 }
 
+BOUND_STATUSES = frozenset({"Bound", "Proposed"})
+AWAITING_QUOTE_STATUSES = frozenset({"Market", "Submit"})
+DECLINED_STATUSES = frozenset({"Declined", "Blocked", "Lost"})
+
 STATUS_PRIORITY = {
     "Incumbent": 0, "Bound": 1, "Proposed": 2, "Quoted": 3,
     "Market": 4, "Submit": 5, "Pending": 6, "Declined": 7,
@@ -163,148 +229,301 @@ def airtable_headers():
     }
 
 
-def _safe_str(val, default="—"):
-    if val is None:
-        return default
-    if isinstance(val, list):
-        return ", ".join(str(v) for v in val if v is not None) or default
-    s = str(val).strip()
-    return s if s else default
+def _build_airtable_session():
+    """Keep-alive session for api.airtable.com with retries on rate limits and 5xx."""
+    session = http_requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    session.headers.update(airtable_headers())
+    return session
 
 
-def _safe_currency(val, default="—"):
-    """Format as currency without cents (e.g., $1,788,571)."""
-    if val is None:
-        return default
-    try:
-        n = float(str(val).replace("$", "").replace(",", ""))
-        if n == 0:
-            return default
-        return f"${n:,.0f}"
-    except (ValueError, TypeError):
-        return default
+AIRTABLE_SESSION = _build_airtable_session()
 
 
-def _safe_currency_int(val, default="—"):
-    if val is None:
+def _airtable_get(url, params, fields=None, timeout=30):
+    """
+    GET from Airtable, asking only for `fields` when given.
+    Airtable rejects the whole request (422) if a listed column was renamed or removed,
+    so that case is retried without the field list.
+    """
+    if fields:
+        resp = AIRTABLE_SESSION.get(url, params={**params, "fields[]": fields}, timeout=timeout)
+        if resp.status_code != 422:
+            return resp
+        logger.warning(f"Airtable rejected field list for {url}; retrying with all fields")
+    return AIRTABLE_SESSION.get(url, params=params, timeout=timeout)
+
+
+def _memoize_formatter(func):
+    """lru_cache a pure value formatter. Unhashable inputs (e.g. Airtable lookup lists) bypass the cache."""
+    cached = lru_cache(maxsize=4096, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(val, default=_DASH):
+        try:
+            return cached(val, default)
+        except TypeError:
+            return func(val, default)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _safe_str(val, default=_DASH):
+    # Single-line text fields arrive as str; test that before the lookup-list and None cases
+    if type(val) is str:
+        s = val.strip()
+    elif val is None:
         return default
-    try:
-        n = float(str(val).replace("$", "").replace(",", ""))
-        if n == 0:
-            return default
-        return f"${n:,.0f}"
-    except (ValueError, TypeError):
+    elif isinstance(val, list):
+        s = ", ".join(str(v) for v in val if v is not None)
+    else:
+        s = str(val).strip()
+    if not s:
         return default
+    # Airtable values that are literally an em dash map onto the shared sentinel
+    return _DASH if s == _DASH else s
+
+
+# Thousands separators, currency and percent signs Airtable leaves in numeric text
+_NUMERIC_NOISE = str.maketrans("", "", "$,%")
 
 
-def _safe_number(val, default="—"):
+def _coerce_float(val):
+    """Parse a raw Airtable number ("$1,250.00", "15%", 1250) as a float, or None if it isn't one."""
     if val is None:
-        return default
+        return None
     try:
-        n = float(str(val).replace(",", ""))
-        if n == 0:
-            return default
-        if n == int(n):
-            return f"{int(n):,}"
-        return f"{n:,.2f}"
+        return float(str(val).translate(_NUMERIC_NOISE))
     except (ValueError, TypeError):
+        return None
+
+
+@_memoize_formatter
+def _safe_currency(val, default=_DASH):
+    """Format as currency without cents (e.g., $1,788,571)."""
+    n = _coerce_float(val)
+    if not n:
         return default
+    return f"${n:,.0f}"
 
 
-def _safe_percent(val, default="—"):
-    if val is None:
+# Whole-dollar fields (TIV, sales, payroll) share the currency formatter and its cache
+_safe_currency_int = _safe_currency
+
+
+@_memoize_formatter
+def _safe_number(val, default=_DASH):
+    n = _coerce_float(val)
+    # "nan"/"inf" parse as floats but have no integer form
+    if not n or not math.isfinite(n):
         return default
-    try:
-        n = float(val)
-        if n == 0:
-            return default
-        return f"{n:.2%}" if n < 1 else f"{n:.2f}%"
-    except (ValueError, TypeError):
+    if n == int(n):
+        return f"{int(n):,}"
+    return f"{n:,.2f}"
+
+
+@_memoize_formatter
+def _safe_percent(val, default=_DASH):
+    n = _coerce_float(val)
+    if not n:
         return default
+    return f"{n:.2%}" if n < 1 else f"{n:.2f}%"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_signed_money(x):
+    """Format a premium change as +$1,234 / -$1,234, or an em dash when there is no change."""
+    if not x:
+        return _DASH
+    return f"+${x:,.0f}" if x > 0 else f"-${abs(x):,.0f}"
 
 
+@lru_cache(maxsize=1024)
+def _fmt_signed_pct(x):
+    """Format a percent change as +5.2% / -5.2%, or an em dash when there is no change."""
+    if not x:
+        return _DASH
+    return f"+{x:.1f}%" if x > 0 else f"{x:.1f}%"
+
+
+@lru_cache(maxsize=512)
+def _truncate_str(text, limit):
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _truncate_comment(comments, limit=100):
+    """Carrier notes from a policy comment, clipped to limit chars; non-text or empty comments give ""."""
+    if not isinstance(comments, str) or not comments:
+        return ""
+    return _truncate_str(comments, limit)
+
+
+@lru_cache(maxsize=256)
 def _resolve_carrier_name(raw_name):
     """Resolve carrier abbreviation to full name using the carrier map."""
     if not raw_name or raw_name == "N/A":
         return raw_name or "N/A"
     name = str(raw_name).strip()
     # Check if the raw name is an abbreviation
-    upper = name.upper()
-    if upper in CARRIER_ABBR_MAP:
-        return CARRIER_ABBR_MAP[upper]
-    # Check if it contains a known abbreviation as a substring
-    for abbr, full in CARRIER_ABBR_MAP.items():
-        if name.upper() == abbr:
-            return full
-    return name
+    return CARRIER_ABBR_MAP.get(name.upper(), name)
 
 
 def _fmt_limit(val):
     """Format limits as $20M, $10M, $5M, $500k, etc."""
-    if not val or val == "\u2014" or val == "—":
-        return "\u2014"
-    try:
-        clean = str(val).replace("$", "").replace(",", "").strip()
-        num = float(clean)
-        if num >= 1_000_000:
-            m = num / 1_000_000
-            if m == int(m):
-                return f"${int(m)}M"
-            else:
-                return f"${m:.1f}M"
-        elif num >= 1_000:
-            k = num / 1_000
-            if k == int(k):
-                return f"${int(k)}k"
-            else:
-                return f"${k:.1f}k"
-        elif num > 0:
-            return f"${int(num):,}"
-        else:
-            return "\u2014"
-    except (ValueError, TypeError):
-        return str(val) if val else "\u2014"
+    if not val or val == _DASH:
+        return _DASH
+    # Exact type check: bool is an int subclass, and checkbox fields must keep the string path
+    if type(val) in (int, float):
+        num = val
+    else:
+        num = _coerce_float(val)
+        if num is None:
+            return str(val)
+    # Most limits are in the millions, so that branch is tested first
+    if num >= 1_000_000:
+        m = num / 1_000_000
+        return f"${int(m)}M" if m == int(m) else f"${m:.1f}M"
+    if num >= 1_000:
+        k = num / 1_000
+        return f"${int(k)}k" if k == int(k) else f"${k:.1f}k"
+    if num > 0:
+        return f"${int(num):,}"
+    return _DASH
+
+
+_LIMIT_SUFFIX = {"M": 1_000_000, "k": 1_000, "K": 1_000}
+
+
+def _parse_limit(val):
+    """Read a limit back as dollars ("$2.5M" -> 2500000.0, "$1,000,000" -> 1000000.0); None if absent."""
+    if not val or val is _DASH:
+        return None
+    text = str(val).strip()
+    mult = _LIMIT_SUFFIX.get(text[-1:])
+    if mult:
+        n = _coerce_float(text[:-1])
+        return None if n is None else n * mult
+    return _coerce_float(text)
 
 
 def _get_float(val, default=0):
-    if val is None:
-        return default
-    try:
-        return float(str(val).replace("$", "").replace(",", "").replace("%", ""))
-    except (ValueError, TypeError):
-        return default
+    n = _coerce_float(val)
+    return default if n is None else n
 
 
-def _resolve_broker_names(broker_record_ids: list) -> str:
-    """Resolve broker linked record IDs to company names via Airtable API."""
-    if not broker_record_ids or not AIRTABLE_PAT:
-        return "—"
-    names = []
-    companies_table = os.environ.get("COMPANIES_TABLE_ID", "tblMPEvjv6mcSwdSd")  # Companies table
-    for rid in broker_record_ids:
-        if not isinstance(rid, str) or not rid.startswith("rec"):
-            continue
-        url = f"https://api.airtable.com/v0/{SALES_BASE_ID}/{companies_table}/{rid}"
+# Companies record ID -> (time.monotonic() when fetched, broker name). Only resolved names
+# are kept, and they expire like the client cache, so renames and failed lookups are retried.
+_broker_name_cache = {}
+BROKER_NAME_CACHE_MAX = 512
+BROKER_LOOKUP_BATCH_SIZE = 20
+
+
+def _broker_record_ids(values) -> list:
+    return [rid for rid in values if isinstance(rid, str) and rid.startswith("rec")]
+
+
+def _get_cached_broker_name(rid):
+    """Cached broker name for rid, or None if never resolved or older than CLIENT_DATA_TTL_SECONDS."""
+    entry = _broker_name_cache.get(rid)
+    if entry is None:
+        return None
+    stored_at, name = entry
+    if time.monotonic() - stored_at > CLIENT_DATA_TTL_SECONDS:
+        _broker_name_cache.pop(rid, None)
+        return None
+    return name
+
+
+def _store_broker_name(rid, name):
+    if rid not in _broker_name_cache and len(_broker_name_cache) >= BROKER_NAME_CACHE_MAX:
+        # Drop the oldest entry (dicts keep insertion order)
+        _broker_name_cache.pop(next(iter(_broker_name_cache)), None)
+    _broker_name_cache[rid] = (time.monotonic(), name)
+
+
+def _fetch_broker_names(broker_record_ids: list) -> dict:
+    """
+    Map each broker record ID that resolves to its name, fetching uncached IDs in
+    one filterByFormula request per batch. IDs without a usable name are left out.
+    """
+    names = {}
+    missing = []
+    for rid in dict.fromkeys(broker_record_ids):
+        name = _get_cached_broker_name(rid)
+        if name is None:
+            missing.append(rid)
+        else:
+            names[rid] = name
+    if not missing or not AIRTABLE_PAT:
+        return names
+    url = f"https://api.airtable.com/v0/{SALES_BASE_ID}/{COMPANIES_TABLE_ID}"
+    for i in range(0, len(missing), BROKER_LOOKUP_BATCH_SIZE):
+        batch = missing[i:i + BROKER_LOOKUP_BATCH_SIZE]
+        conditions = [f'RECORD_ID()="{rid}"' for rid in batch]
+        formula = f"OR({','.join(conditions)})" if len(conditions) > 1 else conditions[0]
+        params = {"filterByFormula": formula, "pageSize": 100}
         try:
-            resp = http_requests.get(url, headers=airtable_headers(), timeout=10)
+            resp = _airtable_get(url, params, BROKER_FIELDS, timeout=10)
             resp.raise_for_status()
-            data = resp.json()
-            flds = data.get("fields", {})
+            records = resp.json().get("records", [])
+        except Exception as e:
+            logger.warning(f"Could not resolve broker records {batch}: {e}")
+            continue
+        for rec in records:
+            flds = rec.get("fields", {})
             # Try ABBR first, then Name
             name = flds.get("ABBR") or flds.get("Name") or flds.get("Company Name") or ""
-            if name:
-                names.append(str(name).strip())
-        except Exception as e:
-            logger.warning(f"Could not resolve broker record {rid}: {e}")
-    return ", ".join(names) if names else "—"
+            name = str(name).strip() if name else ""
+            rid = rec.get("id")
+            if name and rid:
+                _store_broker_name(rid, name)
+                names[rid] = name
+    return names
 
 
-def _resolve_broker_from_fields(flds: dict) -> str:
-    """Resolve broker name from policy fields. Checks multiple paths."""
-    # Path 1: Broker ABBR rollup (from Related Broker)
+def _resolve_broker_names(broker_record_ids: list, known_names: dict = None) -> str:
+    """
+    Resolve broker linked record IDs to company names via Airtable API.
+    known_names (from _prefetch_broker_names) skips the lookup for IDs already tried.
+    """
+    if not broker_record_ids or not AIRTABLE_PAT:
+        return _DASH
+    record_ids = _broker_record_ids(broker_record_ids)
+    if known_names is None:
+        known_names = _fetch_broker_names(record_ids)
+    names = [name for name in (known_names.get(rid) for rid in record_ids) if name]
+    return ", ".join(names) if names else _DASH
+
+
+def _broker_abbr(flds: dict):
+    """Stripped Broker ABBR rollup value, or None when it is empty or a dash."""
     broker_abbr = flds.get("Broker ABBR")
-    if broker_abbr and str(broker_abbr).strip() and str(broker_abbr).strip() != "\u2014":
+    if broker_abbr:
         raw = str(broker_abbr).strip()
+        if raw and raw != _DASH:
+            return raw
+    return None
+
+
+def _prefetch_broker_names(policies: list) -> dict:
+    """Resolve every linked broker the policies will need in batched requests; returns ID -> name."""
+    record_ids = []
+    for rec in policies:
+        flds = rec.get("fields", {})
+        brokers = flds.get("Brokers")
+        if brokers and isinstance(brokers, list) and _broker_abbr(flds) is None:
+            record_ids.extend(_broker_record_ids(brokers))
+    return _fetch_broker_names(record_ids) if record_ids else {}
+
+
+def _resolve_broker_from_fields(flds: dict, known_broker_names: dict = None) -> str:
+    """Resolve broker name from policy fields. Checks multiple paths."""
+    # Path 1: Broker ABBR rollup (from Related Broker)
+    raw = _broker_abbr(flds)
+    if raw is not None:
         # Map known abbreviations to full names
         return BROKER_ABBR_MAP.get(raw.upper(), raw)
 
@@ -319,15 +538,15 @@ def _resolve_broker_from_fields(flds: dict) -> str:
     # Path 3: Resolve Brokers linked record IDs
     brokers = flds.get("Brokers")
     if brokers and isinstance(brokers, list) and any(isinstance(b, str) and b.startswith("rec") for b in brokers):
-        resolved = _resolve_broker_names(brokers)
-        if resolved != "\u2014":
+        resolved = _resolve_broker_names(brokers, known_broker_names)
+        if resolved is not _DASH:
             return resolved
 
     # If direct placement with no broker
     if is_direct:
         return "Direct"
 
-    return "\u2014"
+    return _DASH
 
 
 def _normalize_coverage_type(policy_type_raw):
@@ -335,6 +554,12 @@ def _normalize_coverage_type(policy_type_raw):
         pt = policy_type_raw[0] if policy_type_raw else "Other"
     else:
         pt = str(policy_type_raw) if policy_type_raw else "Other"
+    return _coverage_label(pt)
+
+
+@lru_cache(maxsize=256)
+def _coverage_label(pt):
+    """Map a Policy Type value to its coverage line; checks run in priority order."""
     pt_lower = pt.lower().strip()
     if "property" in pt_lower:
         return "Property"
@@ -366,11 +591,23 @@ def _normalize_coverage_type(policy_type_raw):
         return pt if pt else "Other"
 
 
+_COVERAGE_RANK = {ct: i for i, ct in enumerate(COVERAGE_ORDER)}
+# Coverage types outside COVERAGE_ORDER sort after all known ones
+_COVERAGE_RANK_DEFAULT = len(COVERAGE_ORDER)
+
+
 def _coverage_sort_key(coverage_type):
-    try:
-        return COVERAGE_ORDER.index(coverage_type)
-    except ValueError:
-        return len(COVERAGE_ORDER)
+    return _COVERAGE_RANK.get(coverage_type, _COVERAGE_RANK_DEFAULT)
+
+
+@lru_cache(maxsize=128)
+def _sorted_coverage_display(coverage_types):
+    return tuple((ct, COVERAGE_SHORT.get(ct, ct)) for ct in sorted(coverage_types, key=_coverage_sort_key))
+
+
+def _sorted_display(by_coverage):
+    """Return [(coverage_type, short display name), ...] in coverage order, cached per key set."""
+    return _sorted_coverage_display(tuple(by_coverage))
 
 
 def _status_sort_key(status):
@@ -382,13 +619,13 @@ def _map_status_for_display(status):
     s = (status or "").strip()
     if s == "Incumbent":
         return "Expiring"
-    elif s in ("Bound", "Proposed"):
+    elif s in BOUND_STATUSES:
         return s
-    elif s in ("Quoted",):
+    elif s == "Quoted":
         return "Quoted"
-    elif s in ("Market", "Submit"):
+    elif s in AWAITING_QUOTE_STATUSES:
         return "Pending"
-    elif s in ("Declined", "Blocked", "Lost"):
+    elif s in DECLINED_STATUSES:
         return s
     else:
         return s or "Unknown"
@@ -398,13 +635,13 @@ def _status_color_hex(display_status):
     """Return background color hex for carrier column based on display status."""
     if display_status == "Expiring":
         return EXPIRING_GRAY_HEX
-    elif display_status in ("Bound", "Proposed"):
+    elif display_status in BOUND_STATUSES:
         return PROPOSED_GREEN_HEX
     elif display_status == "Quoted":
         return None  # White / alternating
     elif display_status == "Pending":
         return PENDING_YELLOW_HEX
-    elif display_status in ("Declined", "Blocked", "Lost"):
+    elif display_status in DECLINED_STATUSES:
         return "FDE8E8"  # Light red for declined/blocked
     else:
         return None
@@ -414,19 +651,34 @@ def _status_color_hex(display_status):
 # AIRTABLE DATA FETCHING (reuse from marketing_summary.py)
 # ══════════════════════════════════════════════════════════════════════════
 
+_FORMULA_ESCAPES = str.maketrans({'"': '\\"'})
+
+# filterByFormula templates; {name} is the client name after _sanitize_for_formula
+_OPPORTUNITY_SEARCH_CLAUSE = (
+    'SEARCH(LOWER("{name}"), LOWER({{Opportunity Name}})),'
+    'SEARCH(LOWER("{name}"), LOWER(ARRAYJOIN({{Corporate Name}},"")))'
+)
+_POLICY_SEARCH_FORMULA = (
+    'OR('
+    'SEARCH(LOWER("{name}"), LOWER({{Name}})),'
+    'SEARCH(LOWER("{name}"), LOWER(ARRAYJOIN({{Companies}},"")))'
+    ')'
+)
+
+
 def _sanitize_for_formula(text: str) -> str:
-    return text.replace('"', '\\"')
+    return text.translate(_FORMULA_ESCAPES)
 
 
-def search_opportunity(client_name: str, upcoming_only: bool = True) -> list:
-    safe_name = _sanitize_for_formula(client_name)
-    dq = '"'
-    search_part = (
-        f"OR("
-        f"SEARCH(LOWER({dq}{safe_name}{dq}), LOWER({{Opportunity Name}})),"
-        f"SEARCH(LOWER({dq}{safe_name}{dq}), LOWER(ARRAYJOIN({{Corporate Name}},{dq}{dq})))"
-        f")"
-    )
+def _opportunity_search_clause(term: str) -> str:
+    return _OPPORTUNITY_SEARCH_CLAUSE.format(name=_sanitize_for_formula(term))
+
+
+def _query_opportunities(search_part: str, upcoming_only: bool, all_pages: bool = False) -> list:
+    """
+    Opportunities matching search_part, soonest Effective Date first.
+    Only the first page of 20 is fetched unless all_pages is set, which follows Airtable offsets.
+    """
     if upcoming_only:
         formula = f"AND({search_part}, {{Days to Expiration}} >= 0)"
     else:
@@ -437,74 +689,105 @@ def search_opportunity(client_name: str, upcoming_only: bool = True) -> list:
         "filterByFormula": formula,
         "sort[0][field]": "Effective Date",
         "sort[0][direction]": "asc",
-        "pageSize": 20,
+        "pageSize": 100 if all_pages else 20,
     }
-    try:
-        resp = http_requests.get(url, headers=airtable_headers(), params=params, timeout=30)
-        resp.raise_for_status()
-        return resp.json().get("records", [])
-    except Exception as e:
-        logger.error(f"Error searching opportunities: {e}")
-        return []
+    records = []
+    while True:
+        try:
+            resp = _airtable_get(url, params, OPPORTUNITY_FIELDS)
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            logger.error(f"Error searching opportunities: {e}")
+            return records
+        records.extend(data.get("records", []))
+        offset = data.get("offset")
+        if not (all_pages and offset):
+            return records
+        params["offset"] = offset
 
 
-def fetch_policies_by_record_ids(policy_record_ids: list) -> list:
-    if not policy_record_ids:
+def search_opportunity(client_name: str, upcoming_only: bool = True) -> list:
+    return _query_opportunities(f"OR({_opportunity_search_clause(client_name)})", upcoming_only)
+
+
+def search_opportunity_any(terms: list, upcoming_only: bool = True) -> list:
+    """
+    Every opportunity matching any of the terms, fetched with one OR formula (all pages),
+    in Airtable's Effective Date order. Use _first_opportunity_matching to pick per term.
+    """
+    if not terms:
         return []
-    all_records = []
-    batch_size = 20
-    for i in range(0, len(policy_record_ids), batch_size):
-        batch = policy_record_ids[i:i + batch_size]
-        conditions = [f'RECORD_ID()="{rid}"' for rid in batch]
-        formula = f"OR({','.join(conditions)})" if len(conditions) > 1 else conditions[0]
-        url = f"https://api.airtable.com/v0/{SALES_BASE_ID}/{POLICIES_TABLE_ID}"
-        offset = None
-        while True:
-            params = {"filterByFormula": formula, "pageSize": 100}
-            if offset:
-                params["offset"] = offset
-            try:
-                resp = http_requests.get(url, headers=airtable_headers(), params=params, timeout=30)
-                resp.raise_for_status()
-                data = resp.json()
-                all_records.extend(data.get("records", []))
-                offset = data.get("offset")
-                if not offset:
-                    break
-            except Exception as e:
-                logger.error(f"Error fetching policies by record IDs: {e}")
-                break
-    return all_records
+    clauses = ",".join(_opportunity_search_clause(t) for t in terms)
+    return _query_opportunities(f"OR({clauses})", upcoming_only, all_pages=True)
 
 
-def fetch_policies_for_client(client_name: str) -> list:
-    safe_name = _sanitize_for_formula(client_name)
-    dq = '"'
-    formula = (
-        f"OR("
-        f"SEARCH(LOWER({dq}{safe_name}{dq}), LOWER({{Name}})),"
-        f"SEARCH(LOWER({dq}{safe_name}{dq}), LOWER(ARRAYJOIN({{Companies}},{dq}{dq})))"
-        f")"
-    )
+def _first_opportunity_matching(records: list, term: str):
+    """
+    First record whose Opportunity Name or Corporate Name contains term (case-insensitive),
+    i.e. what search_opportunity(term)[0] would return from the same filtered, sorted set.
+    """
+    term = term.lower()
+    for rec in records:
+        flds = rec.get("fields", {})
+        corporate = flds.get("Corporate Name") or ""
+        if isinstance(corporate, list):
+            corporate = "".join(str(c) for c in corporate)
+        if term in str(flds.get("Opportunity Name", "")).lower() or term in corporate.lower():
+            return rec
+    return None
+
+
+POLICY_FETCH_BATCH_SIZE = 20
+POLICY_FETCH_WORKERS = 4
+
+
+def _iter_policy_records(formula: str, error_label: str):
+    """Yield Policies records matching formula one page at a time, following Airtable offsets."""
     url = f"https://api.airtable.com/v0/{SALES_BASE_ID}/{POLICIES_TABLE_ID}"
-    all_records = []
     offset = None
     while True:
         params = {"filterByFormula": formula, "pageSize": 100}
         if offset:
             params["offset"] = offset
         try:
-            resp = http_requests.get(url, headers=airtable_headers(), params=params, timeout=30)
+            resp = _airtable_get(url, params, POLICY_FIELDS)
             resp.raise_for_status()
             data = resp.json()
-            all_records.extend(data.get("records", []))
-            offset = data.get("offset")
-            if not offset:
-                break
         except Exception as e:
-            logger.error(f"Error fetching policies: {e}")
-            break
-    return all_records
+            logger.error(f"Error fetching {error_label}: {e}")
+            return
+        yield from data.get("records", [])
+        offset = data.get("offset")
+        if not offset:
+            return
+
+
+def _fetch_policy_batch(formula: str) -> list:
+    """Fetch all pages of Policies matching one RECORD_ID() formula."""
+    return list(_iter_policy_records(formula, "policies by record IDs"))
+
+
+def fetch_policies_by_record_ids(policy_record_ids: list) -> list:
+    if not policy_record_ids:
+        return []
+    formulas = []
+    for i in range(0, len(policy_record_ids), POLICY_FETCH_BATCH_SIZE):
+        batch = policy_record_ids[i:i + POLICY_FETCH_BATCH_SIZE]
+        conditions = [f'RECORD_ID()="{rid}"' for rid in batch]
+        formulas.append(f"OR({','.join(conditions)})" if len(conditions) > 1 else conditions[0])
+
+    if len(formulas) == 1:
+        return _fetch_policy_batch(formulas[0])
+    # Batches are independent GETs; overlap them on the shared session (results keep batch order)
+    with ThreadPoolExecutor(max_workers=min(POLICY_FETCH_WORKERS, len(formulas))) as pool:
+        results = list(pool.map(_fetch_policy_batch, formulas))
+    return [rec for batch_records in results for rec in batch_records]
+
+
+def fetch_policies_for_client(client_name: str) -> list:
+    formula = _POLICY_SEARCH_FORMULA.format(name=_sanitize_for_formula(client_name))
+    return list(_iter_policy_records(formula, "policies"))
 
 
 async def resolve_client_data(client_name: str):
@@ -526,23 +809,24 @@ async def resolve_client_data(client_name: str):
     if policies:
         return None, policies
 
-    # Try individual words
-    words = client_name.strip().split()
-    if len(words) > 1:
+    # Try individual words: one OR search fetches every word's opportunities up front,
+    # then each word tries its own best opportunity before falling back to a policy search
+    all_words = client_name.strip().split()
+    words = [w for w in all_words if len(w) >= 3]
+    if len(all_words) > 1 and words:
+        candidates = search_opportunity_any(words)
         for word in words:
-            if len(word) >= 3:
-                opportunities = search_opportunity(word)
-                if opportunities:
-                    opp = opportunities[0]
-                    opp_fields = opp.get("fields", {})
-                    policy_ids = opp_fields.get("Policies", [])
-                    if policy_ids:
-                        policies = fetch_policies_by_record_ids(policy_ids)
-                        if policies:
-                            return opp_fields, policies
-                policies = fetch_policies_for_client(word)
-                if policies:
-                    return None, policies
+            opp = _first_opportunity_matching(candidates, word)
+            if opp:
+                opp_fields = opp.get("fields", {})
+                policy_ids = opp_fields.get("Policies", [])
+                if policy_ids:
+                    policies = fetch_policies_by_record_ids(policy_ids)
+                    if policies:
+                        return opp_fields, policies
+            policies = fetch_policies_for_client(word)
+            if policies:
+                return None, policies
 
     return None, []
 
@@ -554,6 +838,7 @@ async def resolve_client_data(client_name: str):
 def parse_policies(policies: list):
     """Parse raw Airtable policy records into structured dicts grouped by coverage type."""
     parsed = []
+    broker_names = _prefetch_broker_names(policies)
     for rec in policies:
         flds = rec.get("fields", {})
         coverage_type = _normalize_coverage_type(flds.get("Policy Type"))
@@ -576,6 +861,7 @@ def parse_policies(policies: list):
         premium_with_tax = premium_tx if premium_tx > 0 else base_premium
 
         commission = _get_float(flds.get("Commission"))
+        # Missing revenue parses to 0 so totals can sum it unguarded
         revenue = _get_float(flds.get("Revenue"))
 
         parsed.append({
@@ -587,7 +873,7 @@ def parse_policies(policies: list):
             "premium_tx": premium_with_tax,
             "commission": commission,
             "revenue": revenue,
-            "broker": _resolve_broker_from_fields(flds),
+            "broker": _resolve_broker_from_fields(flds, broker_names),
             "units": flds.get("Units"),
             "num_locs": flds.get("# of Locs"),
             "tiv": flds.get("TIV"),
@@ -612,76 +898,217 @@ def parse_policies(policies: list):
             "safety_credit": flds.get("Safety"),
             "drug_free_credit": flds.get("Drug Free"),
             "comments": flds.get("Comments", ""),
-            "fields": flds,
         })
 
     return parsed
 
 
+def _group_sort_key(p):
+    ct = p["coverage_type"]
+    return _coverage_sort_key(ct), ct, _status_sort_key(p["status"])
+
+
 def group_by_coverage(parsed_policies):
-    """Group parsed policies by coverage type, sorted by coverage order."""
-    by_coverage = defaultdict(list)
-    for p in parsed_policies:
-        by_coverage[p["coverage_type"]].append(p)
+    """
+    Group parsed policies by coverage type, sorted by coverage order.
+    Returns a plain dict; every entry holds at least one policy.
+    """
+    # One stable sort puts coverages in COVERAGE_ORDER (unknown types by name) and, within each,
+    # carriers Expiring first, then Bound/Proposed, then Quoted, then Pending
+    ordered = sorted(parsed_policies, key=_group_sort_key)
+    return {ct: list(group) for ct, group in groupby(ordered, key=itemgetter("coverage_type"))}
+
+
+# Status -> bucket used by the highlights, next steps and summary tables
+_STATUS_BUCKET = {
+    "Incumbent": "incumbent",
+    **dict.fromkeys(BOUND_STATUSES, "bound"),
+    "Quoted": "quoted",
+    **dict.fromkeys(AWAITING_QUOTE_STATUSES, "awaiting"),
+    "Pending": "pending",
+}
 
-    # Sort carriers within each coverage: Expiring first, then Bound/Proposed, then Quoted, then Pending
-    for ct in by_coverage:
-        by_coverage[ct].sort(key=lambda p: _status_sort_key(p["status"]))
 
-    return by_coverage
+def _mentions_inc(comments):
+    """True when a lowercased comment has "inc " in its first 10 chars (e.g. "epli inc in gl")."""
+    return comments.find("inc ", 0, 10) != -1
+
+
+def bucket_by_status(by_coverage):
+    """
+    Split each coverage's policies into incumbent / bound / quoted / awaiting / pending lists.
+    Lists keep by_coverage order, so Bound policies precede Proposed ones within "bound".
+    "incumbent_premium" and "bound_premium" hold the premium_tx totals of those two lists;
+    "bundled" flags a coverage whose comments mark it as included in another (e.g. EPLI in GL);
+    "included" is the stricter flag for comments containing the word "included".
+    """
+    buckets = {}
+    for ct, policies in by_coverage.items():
+        b = {"incumbent": [], "bound": [], "quoted": [], "awaiting": [], "pending": []}
+        incumbent_premium = bound_premium = 0
+        bundled = included = False
+        for p in policies:
+            if not included:
+                comments = str(p.get("comments", "")).lower()
+                if "included" in comments:
+                    bundled = included = True
+                elif not bundled:
+                    bundled = _mentions_inc(comments)
+            key = _STATUS_BUCKET.get(p["status"])
+            if key:
+                b[key].append(p)
+                if key == "incumbent":
+                    incumbent_premium += p["premium_tx"]
+                elif key == "bound":
+                    bound_premium += p["premium_tx"]
+        b["incumbent_premium"] = incumbent_premium
+        b["bound_premium"] = bound_premium
+        b["bundled"] = bundled
+        b["included"] = included
+        buckets[ct] = b
+    return buckets
 
 
 # ══════════════════════════════════════════════════════════════════════════
 # DOCX BUILDING UTILITIES
 # ══════════════════════════════════════════════════════════════════════════
 
+# Character styles pre-defined in the starter template: name -> (size, color, bold, italic)
+RUN_STYLES = {
+    "MU-MetricValue-9": (9, CLASSIC_BLUE, False, False),
+    "MU-MetricValue-9-Pending": (9, CHARCOAL, False, False),
+    "MU-Premium-10": (10, CLASSIC_BLUE, True, False),
+    "MU-Premium-10-Pending": (10, CHARCOAL, True, False),
+    "MU-NoteItalic-8": (8, CHARCOAL, False, True),
+    "MU-Header-10": (10, WHITE, True, False),
+    "MU-CarrierName-9": (9, WHITE, True, False),
+    "MU-CarrierStatus-8": (8, PALE_BLUE, False, True),
+    "MU-Label-9": (9, CLASSIC_BLUE, True, False),
+    "MU-LabelItalic-9": (9, CLASSIC_BLUE, True, True),
+    "MU-Cell-9": (9, CLASSIC_BLUE, False, False),
+    "MU-Cell-9-Total": (9, WHITE, True, False),
+    "MU-Cell-9-Decrease": (9, DARK_GREEN, False, False),
+    "MU-Cell-9-Increase": (9, DARK_RED, False, False),
+}
+
+_STARTER_DOCX_BYTES = None
+
+# xmlns:w declaration shared by every parse_xml fragment below
+_W_NS = nsdecls("w")
+# Clark-notation tags and attributes for the tblPr/tcPr children the helpers below build
+_QN_W = qn('w:w')
+_QN_VAL = qn('w:val')
+_QN_FILL = qn('w:fill')
+_QN_TBLBORDERS = qn('w:tblBorders')
+_QN_TBLLAYOUT = qn('w:tblLayout')
+_QN_TBLW = qn('w:tblW')
+
+
+def _rpr_template(size, color, bold=False, italic=False):
+    """Build a reusable Calibri <w:rPr> for runs styled directly rather than via RUN_STYLES."""
+    return parse_xml(
+        f'<w:rPr {_W_NS}><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/>'
+        f'{"<w:b/>" if bold else ""}{"<w:i/>" if italic else ""}'
+        f'<w:color w:val="{color}"/><w:sz w:val="{size * 2}"/></w:rPr>'
+    )
+
+
+_RPR_EMPHASIS_10 = _rpr_template(10, ELECTRIC_BLUE, bold=True)
+_RPR_DESC_9 = _rpr_template(9, CLASSIC_BLUE)
+_RPR_STEP_10 = _rpr_template(10, CLASSIC_BLUE)
+
+
+def _apply_rpr(run, template):
+    """Give a freshly added run a copy of a prebuilt <w:rPr>."""
+    run._r.insert(0, deepcopy(template))
+
+
+def _build_starter_template():
+    """Serialize python-docx's default template with the marketing update run styles added."""
+    doc = Document()
+    for name, (size, color, bold, italic) in RUN_STYLES.items():
+        font = doc.styles.add_style(name, WD_STYLE_TYPE.CHARACTER).font
+        font.name = "Calibri"
+        font.size = Pt(size)
+        font.color.rgb = color
+        if bold:
+            font.bold = True
+        if italic:
+            font.italic = True
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+_DOC_RUN_STYLES = weakref.WeakKeyDictionary()
+
+
+def _run_styles(doc):
+    """RUN_STYLES name -> style object for this document, resolved once per document."""
+    part = doc.part
+    styles = _DOC_RUN_STYLES.get(part)
+    if styles is None:
+        doc_styles = doc.styles
+        styles = {name: doc_styles[name] for name in RUN_STYLES}
+        _DOC_RUN_STYLES[part] = styles
+    return styles
+
+
+def _new_document():
+    """Return a fresh Document from the starter template, built once per process."""
+    global _STARTER_DOCX_BYTES
+    if _STARTER_DOCX_BYTES is None:
+        _STARTER_DOCX_BYTES = _build_starter_template()
+    return Document(io.BytesIO(_STARTER_DOCX_BYTES))
+
+
+@lru_cache(maxsize=256)
+def _oxml_template(xml):
+    """Parsed element for an XML fragment; callers append deepcopies, never the template."""
+    return parse_xml(xml)
+
+
+def _oxml(xml):
+    return deepcopy(_oxml_template(xml))
+
+
 def set_cell_shading(cell, color_hex):
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
+    cell._tc.get_or_add_tcPr().append(OxmlElement("w:shd", {_QN_FILL: color_hex, _QN_VAL: "clear"}))
 
 
-def set_cell_width(cell, width_inches):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcW = parse_xml(f'<w:tcW {nsdecls("w")} w:w="{int(width_inches * 1440)}" w:type="dxa"/>')
-    existing = tcPr.find(qn('w:tcW'))
-    if existing is not None:
-        tcPr.remove(existing)
-    tcPr.append(tcW)
+_TCPR_CACHE = {}
 
 
-def set_cell_vertical_alignment(cell, val="center"):
+def set_cell_props(cell, width_dxa, shading_hex=None, valign=None):
+    """Replace the cell's <w:tcPr> with a cached width/shading/vertical-alignment template."""
+    key = (width_dxa, shading_hex, valign)
+    tcPr = _TCPR_CACHE.get(key)
+    if tcPr is None:
+        parts = [f'<w:tcW w:w="{width_dxa}" w:type="dxa"/>']
+        if shading_hex:
+            parts.append(f'<w:shd w:fill="{shading_hex}" w:val="clear"/>')
+        if valign:
+            parts.append(f'<w:vAlign w:val="{valign}"/>')
+        tcPr = parse_xml(f'<w:tcPr {_W_NS}>{"".join(parts)}</w:tcPr>')
+        _TCPR_CACHE[key] = tcPr
     tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    vAlign = parse_xml(f'<w:vAlign {nsdecls("w")} w:val="{val}"/>')
-    existing = tcPr.find(qn('w:vAlign'))
+    existing = tc.tcPr
     if existing is not None:
-        tcPr.remove(existing)
-    tcPr.append(vAlign)
+        tc.remove(existing)
+    tc.insert(0, deepcopy(tcPr))
 
 
-def remove_cell_borders(cell):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    borders = parse_xml(
-        f'<w:tcBorders {nsdecls("w")}>'
-        f'<w:top w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:left w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:bottom w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:right w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'</w:tcBorders>'
-    )
-    existing = tcPr.find(qn('w:tcBorders'))
-    if existing is not None:
-        tcPr.remove(existing)
-    tcPr.append(borders)
+def set_grid_widths(table, widths_dxa):
+    """Write column widths (twips) into the table's <w:tblGrid> in one pass."""
+    for grid_col, width_dxa in zip(table._tbl.tblGrid.gridCol_lst, widths_dxa):
+        grid_col.set(_QN_W, str(width_dxa))
 
 
 def remove_table_borders(table):
     tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-    borders = parse_xml(
-        f'<w:tblBorders {nsdecls("w")}>'
+    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {_W_NS}/>')
+    borders = _oxml(
+        f'<w:tblBorders {_W_NS}>'
         f'<w:top w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
         f'<w:left w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
         f'<w:bottom w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
@@ -690,17 +1117,81 @@ def remove_table_borders(table):
         f'<w:insideV w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
         f'</w:tblBorders>'
     )
-    existing = tblPr.find(qn('w:tblBorders'))
+    existing = tblPr.find(_QN_TBLBORDERS)
     if existing is not None:
         tblPr.remove(existing)
     tblPr.append(borders)
 
 
+_NO_BORDER_EDGES = "".join(
+    f'<w:{edge} w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    for edge in ("top", "left", "bottom", "right")
+)
+
+
+@lru_cache(maxsize=8)
+def _contact_table_template(contacts, name_width, role_width):
+    """Borderless name/role <w:tbl> for a tuple of (name, role) pairs, built once."""
+    name_dxa = int(name_width * 1440)
+    role_dxa = int(role_width * 1440)
+    ppr = '<w:pPr><w:spacing w:before="40" w:after="40"/></w:pPr>'
+    name_rpr = (f'<w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b/>'
+                f'<w:color w:val="{CLASSIC_BLUE}"/><w:sz w:val="18"/></w:rPr>')
+    role_rpr = (f'<w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/>'
+                f'<w:color w:val="{CHARCOAL}"/><w:sz w:val="18"/></w:rPr>')
+
+    def cell(width_dxa, rpr, text):
+        return (
+            f'<w:tc><w:tcPr><w:tcW w:w="{width_dxa}" w:type="dxa"/>'
+            f'<w:tcBorders>{_NO_BORDER_EDGES}</w:tcBorders></w:tcPr>'
+            f'<w:p>{ppr}<w:r>{rpr}<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r></w:p></w:tc>'
+        )
+
+    rows = "".join(
+        f'<w:tr>{cell(name_dxa, name_rpr, name)}{cell(role_dxa, role_rpr, role)}</w:tr>'
+        for name, role in contacts
+    )
+    tbl = parse_xml(
+        f'<w:tbl {_W_NS}>'
+        f'<w:tblPr><w:tblW w:type="auto" w:w="0"/><w:jc w:val="left"/>'
+        f'<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        f'w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        f'<w:tblBorders>{_NO_BORDER_EDGES}'
+        f'<w:insideH w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+        f'<w:insideV w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+        f'</w:tblBorders></w:tblPr>'
+        f'<w:tblGrid><w:gridCol w:w="{name_dxa}"/><w:gridCol w:w="{role_dxa}"/></w:tblGrid>'
+        f'{rows}</w:tbl>'
+    )
+    return tbl
+
+
+def add_contact_table(doc, contacts=TEAM_CONTACTS, name_width=1.8, role_width=5.7):
+    """Append a copy of the cached contacts table."""
+    tbl = _contact_table_template(tuple(contacts), name_width, role_width)
+    doc.element.body._insert_tbl(deepcopy(tbl))
+
+
+# Rendered disclaimer callouts keyed by page block width (the grid width depends on margins)
+_DISCLAIMER_TEMPLATES = {}
+
+
+def add_disclaimer(doc):
+    """Append the disclaimer callout, copying the first rendering for this page width."""
+    width = doc._block_width
+    tbl = _DISCLAIMER_TEMPLATES.get(width)
+    if tbl is None:
+        tbl = add_callout_box(doc, DISCLAIMER_TEXT, size=8)._tbl
+        _DISCLAIMER_TEMPLATES[width] = deepcopy(tbl)
+        return
+    doc.element.body._insert_tbl(deepcopy(tbl))
+
+
 def set_thin_borders(table):
     tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-    borders = parse_xml(
-        f'<w:tblBorders {nsdecls("w")}>'
+    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {_W_NS}/>')
+    borders = _oxml(
+        f'<w:tblBorders {_W_NS}>'
         f'<w:top w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>'
         f'<w:left w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>'
         f'<w:bottom w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>'
@@ -709,7 +1200,7 @@ def set_thin_borders(table):
         f'<w:insideV w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>'
         f'</w:tblBorders>'
     )
-    existing = tblPr.find(qn('w:tblBorders'))
+    existing = tblPr.find(_QN_TBLBORDERS)
     if existing is not None:
         tblPr.remove(existing)
     tblPr.append(borders)
@@ -719,20 +1210,17 @@ def add_page_header(doc):
     section = doc.sections[-1]
     header = section.header
     header.is_linked_to_previous = False
-    htable = header.add_table(1, 2, width=Inches(7))
+    htable = header.add_table(1, 2, width=_IN[7])
     htable.alignment = WD_TABLE_ALIGNMENT.CENTER
-    logo_cell = htable.rows[0].cells[0]
-    logo_cell.width = Inches(2.5)
+    logo_cell, text_cell = htable._cells
+    logo_cell.width = _IN[2.5]
     if os.path.exists(LOGO_PATH):
         p = logo_cell.paragraphs[0]
         run = p.add_run()
-        run.add_picture(LOGO_PATH, width=Inches(1.8))
-    text_cell = htable.rows[0].cells[1]
-    text_cell.width = Inches(4.5)
+        run.add_picture(LOGO_PATH, width=_IN[1.8])
+    text_cell.width = _IN[4.5]
     # Intentionally left blank - no subtitle text in header
-    for row in htable.rows:
-        for cell in row.cells:
-            remove_cell_borders(cell)
+    remove_table_borders(htable)
 
 
 def add_formatted_paragraph(doc, text, size=11, color=CLASSIC_BLUE, bold=False,
@@ -740,11 +1228,11 @@ def add_formatted_paragraph(doc, text, size=11, color=CLASSIC_BLUE, bold=False,
                             space_before=0, space_after=0):
     p = doc.add_paragraph()
     p.alignment = alignment
-    p.paragraph_format.space_before = Pt(space_before)
-    p.paragraph_format.space_after = Pt(space_after)
-    p.paragraph_format.line_spacing = Pt(size + 3)
+    p.paragraph_format.space_before = _pt(space_before)
+    p.paragraph_format.space_after = _pt(space_after)
+    p.paragraph_format.line_spacing = _pt(size + 3)
     run = p.add_run(text)
-    run.font.size = Pt(size)
+    run.font.size = _pt(size)
     run.font.color.rgb = color
     run.font.bold = bold
     run.font.italic = italic
@@ -752,6 +1240,23 @@ def add_formatted_paragraph(doc, text, size=11, color=CLASSIC_BLUE, bold=False,
     return p
 
 
+@lru_cache(maxsize=None)
+def _spacer_template(size):
+    """Empty paragraph matching add_formatted_paragraph(doc, "", size=size) with zero spacing."""
+    return parse_xml(
+        f'<w:p {_W_NS}><w:pPr>'
+        f'<w:spacing w:before="0" w:after="0" w:line="{(size + 3) * 20}" w:lineRule="exact"/>'
+        f'<w:jc w:val="left"/></w:pPr>'
+        f'<w:r><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b w:val="0"/><w:i w:val="0"/>'
+        f'<w:color w:val="{CLASSIC_BLUE}"/><w:sz w:val="{size * 2}"/></w:rPr></w:r></w:p>'
+    )
+
+
+def add_spacer(doc, size):
+    """Append a blank spacer line of the given point size."""
+    doc.element.body._insert_p(deepcopy(_spacer_template(size)))
+
+
 def add_section_header(doc, text):
     return add_formatted_paragraph(doc, text, size=22, color=CLASSIC_BLUE, bold=True,
                                    space_before=24, space_after=12)
@@ -764,14 +1269,14 @@ def add_subsection_header(doc, text):
 
 def add_callout_box(doc, text, size=10, shading_hex=EGGSHELL_HEX):
     table = doc.add_table(rows=1, cols=1)
-    cell = table.rows[0].cells[0]
+    cell = table._cells[0]
     set_cell_shading(cell, shading_hex)
     p = cell.paragraphs[0]
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    p.paragraph_format.left_indent = Inches(0.1)
+    p.paragraph_format.space_before = _PT[6]
+    p.paragraph_format.space_after = _PT[6]
+    p.paragraph_format.left_indent = _IN[0.1]
     run = p.add_run(text)
-    run.font.size = Pt(size)
+    run.font.size = _pt(size)
     run.font.color.rgb = CLASSIC_BLUE
     run.font.name = "Calibri"
     run.font.italic = True
@@ -780,21 +1285,21 @@ def add_callout_box(doc, text, size=10, shading_hex=EGGSHELL_HEX):
 
 def add_rich_callout_box(doc, lines, size=10, shading_hex=EGGSHELL_HEX):
     table = doc.add_table(rows=1, cols=1)
-    cell = table.rows[0].cells[0]
+    cell = table._cells[0]
     set_cell_shading(cell, shading_hex)
     p = cell.paragraphs[0]
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    p.paragraph_format.left_indent = Inches(0.1)
+    p.paragraph_format.space_before = _PT[6]
+    p.paragraph_format.space_after = _PT[6]
+    p.paragraph_format.left_indent = _IN[0.1]
     for i, line_data in enumerate(lines):
         if i > 0:
             p = cell.add_paragraph()
-            p.paragraph_format.space_before = Pt(2)
-            p.paragraph_format.space_after = Pt(2)
-            p.paragraph_format.left_indent = Inches(0.1)
+            p.paragraph_format.space_before = _PT[2]
+            p.paragraph_format.space_after = _PT[2]
+            p.paragraph_format.left_indent = _IN[0.1]
         text, bold, color = line_data
         run = p.add_run(text)
-        run.font.size = Pt(size)
+        run.font.size = _pt(size)
         run.font.color.rgb = color
         run.font.name = "Calibri"
         run.font.bold = bold
@@ -803,11 +1308,11 @@ def add_rich_callout_box(doc, lines, size=10, shading_hex=EGGSHELL_HEX):
 
 def add_divider(doc):
     p_div = doc.add_paragraph()
-    p_div.paragraph_format.space_before = Pt(4)
-    p_div.paragraph_format.space_after = Pt(4)
+    p_div.paragraph_format.space_before = _PT[4]
+    p_div.paragraph_format.space_after = _PT[4]
     pPr = p_div._p.get_or_add_pPr()
     pBdr = parse_xml(
-        f'<w:pBdr {nsdecls("w")}>'
+        f'<w:pBdr {_W_NS}>'
         f'<w:bottom w:val="single" w:sz="12" w:space="1" w:color="{ELECTRIC_BLUE_HEX}"/>'
         f'</w:pBdr>'
     )
@@ -821,85 +1326,95 @@ def add_page_break(doc):
 # ══════════════════════════════════════════════════════════════════════════
 # TABLE BUILDERS
 # ══════════════════════════════════════════════════════════════════════════
+# Builders grab table._cells once after add_table() and index the flat list as
+# cells[row * num_cols + col]; table.rows[r].cells[c] rebuilds the cell list
+# on every access.
+
+def _summary_cell_xml(width_dxa, shading_hex, jc, spacing, style_id, text):
+    shd = f'<w:shd w:fill="{shading_hex}" w:val="clear"/>' if shading_hex else ""
+    return (
+        f'<w:tc><w:tcPr><w:tcW w:w="{width_dxa}" w:type="dxa"/>{shd}<w:vAlign w:val="center"/></w:tcPr>'
+        f'<w:p><w:pPr><w:spacing w:before="{spacing}" w:after="{spacing}"/><w:jc w:val="{jc}"/></w:pPr>'
+        f'<w:r><w:rPr><w:rStyle w:val="{style_id}"/></w:rPr>'
+        f'<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r></w:p></w:tc>'
+    )
+
 
 def create_premium_summary_table(doc, headers, rows, col_widths=None, highlight_last_row=False):
-    """Create the premium summary comparison table."""
-    num_cols = len(headers)
-    table = doc.add_table(rows=1 + len(rows), cols=num_cols)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    """Create the premium summary comparison table.
 
-    tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-    tblLayout = parse_xml(f'<w:tblLayout {nsdecls("w")} w:type="fixed"/>')
-    existing = tblPr.find(qn('w:tblLayout'))
-    if existing is not None:
-        tblPr.remove(existing)
-    tblPr.append(tblLayout)
+    The whole <w:tbl> is assembled as one XML string and parsed once rather than
+    created empty by add_table() and then patched cell by cell.
+    """
+    num_cols = len(headers)
     total_width = sum(col_widths) if col_widths else 7.5
-    tblW = parse_xml(f'<w:tblW {nsdecls("w")} w:w="{int(total_width * 1440)}" w:type="dxa"/>')
-    existing_tblW = tblPr.find(qn('w:tblW'))
-    if existing_tblW is not None:
-        tblPr.remove(existing_tblW)
-    tblPr.append(tblW)
-
     if not col_widths:
         col_widths = [total_width / num_cols] * num_cols
+    col_widths_dxa = [int(w * 1440) for w in col_widths]
+
+    styles = _run_styles(doc)
+    header_id = styles["MU-Header-10"].style_id
+    cell_id = styles["MU-Cell-9"].style_id
+    total_id = styles["MU-Cell-9-Total"].style_id
+    # Signed dollar changes: decreases green, increases red
+    sign_style = {
+        "-$": styles["MU-Cell-9-Decrease"].style_id,
+        "+$": styles["MU-Cell-9-Increase"].style_id,
+    }
+
+    parts = [
+        f'<w:tbl {_W_NS}><w:tblPr><w:jc w:val="center"/>'
+        f'<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        f'w:noHBand="0" w:noVBand="1" w:val="04A0"/><w:tblLayout w:type="fixed"/>'
+        f'<w:tblW w:w="{int(total_width * 1440)}" w:type="dxa"/></w:tblPr><w:tblGrid>'
+    ]
+    parts.extend(f'<w:gridCol w:w="{w}"/>' for w in col_widths_dxa)
+    parts.append('</w:tblGrid>')
+
+    # Per-column layout: the first two columns are left-aligned text, the rest centered figures
+    col_jc = ["left" if i < 2 else "center" for i in range(num_cols)]
+    col_is_figure = [i >= 2 for i in range(num_cols)]
 
     # Header row
+    parts.append('<w:tr>')
     for i, header_text in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.text = ""
-        p = cell.paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER if i >= 2 else WD_ALIGN_PARAGRAPH.LEFT
-        p.paragraph_format.space_before = Pt(4)
-        p.paragraph_format.space_after = Pt(4)
-        run = p.add_run(header_text)
-        run.font.size = Pt(10)
-        run.font.color.rgb = WHITE
-        run.font.bold = True
-        run.font.name = "Calibri"
-        set_cell_shading(cell, ELECTRIC_BLUE_HEX)
-        set_cell_width(cell, col_widths[i])
-        set_cell_vertical_alignment(cell, "center")
+        parts.append(_summary_cell_xml(col_widths_dxa[i], ELECTRIC_BLUE_HEX, col_jc[i], 80, header_id, header_text))
+    parts.append('</w:tr>')
 
     # Data rows
+    last_row_idx = len(rows) - 1 if highlight_last_row else -1
     for row_idx, row_data in enumerate(rows):
-        is_total = highlight_last_row and row_idx == len(rows) - 1
+        is_total = row_idx == last_row_idx
+        row_shading = EGGSHELL_HEX if row_idx % 2 == 1 else None
+        parts.append('<w:tr>')
         for col_idx, val in enumerate(row_data):
-            cell = table.rows[row_idx + 1].cells[col_idx]
-            cell.text = ""
-            p = cell.paragraphs[0]
-            if col_idx < 2:
-                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            else:
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.paragraph_format.space_before = Pt(3)
-            p.paragraph_format.space_after = Pt(3)
-            run = p.add_run(str(val))
-            run.font.size = Pt(9)
-            run.font.name = "Calibri"
+            val_str = str(val)
 
             if is_total:
-                run.font.color.rgb = WHITE
-                run.font.bold = True
-                set_cell_shading(cell, CLASSIC_BLUE_HEX)
+                style_id = total_id
+                shading_hex = CLASSIC_BLUE_HEX
             else:
-                run.font.color.rgb = CLASSIC_BLUE
                 # Color code $ Change column
-                val_str = str(val)
-                if "Change" in headers[col_idx] if col_idx < len(headers) else False:
-                    pass
-                if col_idx >= 2 and val_str.startswith("-$"):
-                    run.font.color.rgb = DARK_GREEN
-                elif col_idx >= 2 and val_str.startswith("+$"):
-                    run.font.color.rgb = DARK_RED
-                if row_idx % 2 == 1:
-                    set_cell_shading(cell, EGGSHELL_HEX)
-
-            set_cell_width(cell, col_widths[col_idx])
-            set_cell_vertical_alignment(cell, "center")
+                style_id = sign_style.get(val_str[:2], cell_id) if col_is_figure[col_idx] else cell_id
+                shading_hex = row_shading
 
-    return table
+            parts.append(_summary_cell_xml(col_widths_dxa[col_idx], shading_hex, col_jc[col_idx], 60, style_id, val_str))
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+
+    tbl = parse_xml("".join(parts))
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
+
+
+@lru_cache(maxsize=None)
+def _dash_value_paragraph(style_id):
+    """Centered em-dash metric paragraph, as the comparison value cells lay it out."""
+    return parse_xml(
+        f'<w:p {_W_NS}><w:pPr><w:spacing w:before="60" w:after="60" w:line="240" w:lineRule="exact"/>'
+        f'<w:jc w:val="center"/></w:pPr>'
+        f'<w:r><w:rPr><w:rStyle w:val="{style_id}"/></w:rPr><w:t>{_DASH}</w:t></w:r></w:p>'
+    )
 
 
 def create_carrier_comparison_table(doc, coverage_title, metrics, carriers):
@@ -917,12 +1432,13 @@ def create_carrier_comparison_table(doc, coverage_title, metrics, carriers):
 
     table = doc.add_table(rows=num_rows, cols=num_cols)
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    cells = table._cells
     set_thin_borders(table)
 
     tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-    tblLayout = parse_xml(f'<w:tblLayout {nsdecls("w")} w:type="fixed"/>')
-    existing = tblPr.find(qn('w:tblLayout'))
+    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {_W_NS}/>')
+    tblLayout = _oxml(f'<w:tblLayout {_W_NS} w:type="fixed"/>')
+    existing = tblPr.find(_QN_TBLLAYOUT)
     if existing is not None:
         tblPr.remove(existing)
     tblPr.append(tblLayout)
@@ -930,142 +1446,123 @@ def create_carrier_comparison_table(doc, coverage_title, metrics, carriers):
     total_width = 7.5
     label_width = 1.6
     carrier_width = (total_width - label_width) / max(len(carriers), 1)
+    label_width_dxa = int(label_width * 1440)
+    carrier_width_dxa = int(carrier_width * 1440)
 
-    tblW = parse_xml(f'<w:tblW {nsdecls("w")} w:w="{int(total_width * 1440)}" w:type="dxa"/>')
-    existing_tblW = tblPr.find(qn('w:tblW'))
+    tblW = _oxml(f'<w:tblW {_W_NS} w:w="{int(total_width * 1440)}" w:type="dxa"/>')
+    existing_tblW = tblPr.find(_QN_TBLW)
     if existing_tblW is not None:
         tblPr.remove(existing_tblW)
     tblPr.append(tblW)
+    # Fixed layout takes column widths from the grid; keep it in step with the cell widths
+    set_grid_widths(table, [label_width_dxa] + [carrier_width_dxa] * len(carriers))
+
+    styles = _run_styles(doc)
+    header_style = styles["MU-Header-10"]
+    carrier_name_style = styles["MU-CarrierName-9"]
+    carrier_status_style = styles["MU-CarrierStatus-8"]
+    label_style = styles["MU-Label-9"]
+    value_style = styles["MU-MetricValue-9"]
+    value_pending_style = styles["MU-MetricValue-9-Pending"]
+    premium_style = styles["MU-Premium-10"]
+    premium_pending_style = styles["MU-Premium-10-Pending"]
+    note_style = styles["MU-NoteItalic-8"]
 
     # Header row
-    header_cell = table.rows[0].cells[0]
+    header_cell = cells[0]
     header_cell.text = ""
     p = header_cell.paragraphs[0]
-    p.paragraph_format.space_before = Pt(4)
-    p.paragraph_format.space_after = Pt(4)
-    run = p.add_run(coverage_title)
-    run.font.size = Pt(10)
-    run.font.color.rgb = WHITE
-    run.font.bold = True
-    run.font.name = "Calibri"
-    set_cell_shading(header_cell, ELECTRIC_BLUE_HEX)
-    set_cell_width(header_cell, label_width)
-    set_cell_vertical_alignment(header_cell, "center")
+    p.paragraph_format.space_before = _PT[4]
+    p.paragraph_format.space_after = _PT[4]
+    p.add_run(coverage_title, header_style)
+    set_cell_props(header_cell, label_width_dxa, ELECTRIC_BLUE_HEX, "center")
 
     for c_idx, carrier in enumerate(carriers):
-        cell = table.rows[0].cells[1 + c_idx]
+        cell = cells[1 + c_idx]
         cell.text = ""
         p = cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_before = Pt(4)
-        p.paragraph_format.space_after = Pt(1)
-        p.paragraph_format.line_spacing = Pt(12)
-
-        run = p.add_run(carrier["name"])
-        run.font.size = Pt(9)
-        run.font.color.rgb = WHITE
-        run.font.bold = True
-        run.font.name = "Calibri"
+        p.paragraph_format.space_before = _PT[4]
+        p.paragraph_format.space_after = _PT[1]
+        p.paragraph_format.line_spacing = _PT[12]
+
+        p.add_run(carrier["name"], carrier_name_style)
 
         p2 = cell.add_paragraph()
         p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p2.paragraph_format.space_before = Pt(0)
-        p2.paragraph_format.space_after = Pt(3)
-        p2.paragraph_format.line_spacing = Pt(10)
-        run2 = p2.add_run(f"({carrier['status']})")
-        run2.font.size = Pt(8)
-        run2.font.color.rgb = RGBColor(0xCC, 0xE5, 0xFF)
-        run2.font.italic = True
-        run2.font.name = "Calibri"
-
-        set_cell_shading(cell, ELECTRIC_BLUE_HEX)
-        set_cell_width(cell, carrier_width)
-        set_cell_vertical_alignment(cell, "center")
-
-    # Metric rows
-    for m_idx, metric in enumerate(metrics):
-        label_cell = table.rows[1 + m_idx].cells[0]
-        label_cell.text = ""
-        p = label_cell.paragraphs[0]
-        p.paragraph_format.space_before = Pt(3)
-        p.paragraph_format.space_after = Pt(3)
-        p.paragraph_format.line_spacing = Pt(12)
-        run = p.add_run(metric)
-        run.font.size = Pt(9)
-        run.font.color.rgb = CLASSIC_BLUE
-        run.font.bold = True
-        run.font.name = "Calibri"
-        set_cell_width(label_cell, label_width)
-        set_cell_vertical_alignment(label_cell, "center")
-
-        is_premium_row = (metric == "Premium")
+        p2.paragraph_format.space_before = _PT[0]
+        p2.paragraph_format.space_after = _PT[3]
+        p2.paragraph_format.line_spacing = _PT[10]
+        p2.add_run(f"({carrier['status']})", carrier_status_style)
 
-        for c_idx, carrier in enumerate(carriers):
-            cell = table.rows[1 + m_idx].cells[1 + c_idx]
-            cell.text = ""
-            p = cell.paragraphs[0]
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.paragraph_format.space_before = Pt(3)
-            p.paragraph_format.space_after = Pt(3)
-            p.paragraph_format.line_spacing = Pt(12)
+        set_cell_props(cell, carrier_width_dxa, ELECTRIC_BLUE_HEX, "center")
 
-            val = carrier["values"].get(metric, "—")
-            run = p.add_run(str(val))
-            run.font.size = Pt(9)
-            run.font.name = "Calibri"
+    # Metric rows - value grid (row per carrier, column per metric) and per-carrier status
+    # styling materialized once; active carriers get light banding on odd metric rows
+    grid = [[vals.get(metric, _DASH) for metric in metrics]
+            for vals in [carrier["values"] for carrier in carriers]]
+    carrier_bg = [_status_color_hex(carrier["status"]) for carrier in carriers]
+    carrier_bg_banded = [bg or "FAFAFA" for bg in carrier_bg]
+    carrier_pending = [carrier["status"] == "Pending" for carrier in carriers]
 
-            if is_premium_row:
-                run.font.bold = True
-                run.font.size = Pt(10)
+    for m_idx, metric in enumerate(metrics):
+        row_start = (1 + m_idx) * num_cols
+        label_cell = cells[row_start]
+        label_cell.text = ""
+        p = label_cell.paragraphs[0]
+        p.paragraph_format.space_before = _PT[3]
+        p.paragraph_format.space_after = _PT[3]
+        p.paragraph_format.line_spacing = _PT[12]
+        p.add_run(metric, label_style)
+        set_cell_props(label_cell, label_width_dxa, valign="center")
+
+        if metric == "Premium":
+            pending_style, active_style = premium_pending_style, premium_style
+        else:
+            pending_style, active_style = value_pending_style, value_style
+        row_bg = carrier_bg_banded if m_idx % 2 == 1 else carrier_bg
 
+        for c_idx in range(len(carriers)):
+            cell = cells[row_start + 1 + c_idx]
+            val = grid[c_idx][m_idx]
             # Color coding by status
-            status = carrier["status"]
-            bg_hex = _status_color_hex(status)
-            if bg_hex:
-                set_cell_shading(cell, bg_hex)
-            elif m_idx % 2 == 1:
-                set_cell_shading(cell, "FAFAFA")
-
-            run.font.color.rgb = CLASSIC_BLUE if status != "Pending" else CHARCOAL
-
-            set_cell_width(cell, carrier_width)
-            set_cell_vertical_alignment(cell, "center")
+            run_style = pending_style if carrier_pending[c_idx] else active_style
+            if val is _DASH:
+                # Missing metric (typical for declined carriers): swap in a ready-made dash paragraph
+                tc = cell._tc
+                tc.replace(tc.p_lst[0], deepcopy(_dash_value_paragraph(run_style.style_id)))
+            else:
+                cell.text = ""
+                p = cell.paragraphs[0]
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                p.paragraph_format.space_before = _PT[3]
+                p.paragraph_format.space_after = _PT[3]
+                p.paragraph_format.line_spacing = _PT[12]
+                p.add_run(str(val), run_style)
+            set_cell_props(cell, carrier_width_dxa, row_bg[c_idx], "center")
 
     # Notes row
     if has_notes:
         notes_row_idx = 1 + len(metrics)
-        label_cell = table.rows[notes_row_idx].cells[0]
+        label_cell = cells[notes_row_idx * num_cols]
         label_cell.text = ""
         p = label_cell.paragraphs[0]
-        p.paragraph_format.space_before = Pt(3)
-        p.paragraph_format.space_after = Pt(3)
-        run = p.add_run("Notes")
-        run.font.size = Pt(9)
-        run.font.color.rgb = CLASSIC_BLUE
-        run.font.bold = True
-        run.font.italic = True
-        run.font.name = "Calibri"
-        set_cell_width(label_cell, label_width)
+        p.paragraph_format.space_before = _PT[3]
+        p.paragraph_format.space_after = _PT[3]
+        p.add_run("Notes", styles["MU-LabelItalic-9"])
+        set_cell_props(label_cell, label_width_dxa)
 
         for c_idx, carrier in enumerate(carriers):
-            cell = table.rows[notes_row_idx].cells[1 + c_idx]
+            cell = cells[notes_row_idx * num_cols + 1 + c_idx]
             cell.text = ""
             p = cell.paragraphs[0]
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.paragraph_format.space_before = Pt(3)
-            p.paragraph_format.space_after = Pt(3)
-            p.paragraph_format.line_spacing = Pt(11)
-            note = carrier.get("notes", "—") or "—"
-            run = p.add_run(note)
-            run.font.size = Pt(8)
-            run.font.color.rgb = CHARCOAL
-            run.font.italic = True
-            run.font.name = "Calibri"
-            set_cell_width(cell, carrier_width)
-
-            bg_hex = _status_color_hex(carrier["status"])
-            if bg_hex:
-                set_cell_shading(cell, bg_hex)
+            p.paragraph_format.space_before = _PT[3]
+            p.paragraph_format.space_after = _PT[3]
+            p.paragraph_format.line_spacing = _PT[11]
+            note = carrier.get("notes", _DASH) or _DASH
+            p.add_run(note, note_style)
+            set_cell_props(cell, carrier_width_dxa, carrier_bg[c_idx])
 
     return table
 
@@ -1074,28 +1571,29 @@ def create_carrier_comparison_table(doc, coverage_title, metrics, carriers):
 # COVERAGE-SPECIFIC METRIC BUILDERS
 # ══════════════════════════════════════════════════════════════════════════
 
+def _declined_carrier(p, is_internal=True):
+    """Carrier column for a declined/blocked/lost market: status, broker (internal) and the reason."""
+    values = {"Premium": "Declined"}
+    if is_internal and p["broker"] is not _DASH:
+        values["Broker"] = p["broker"]
+    return {
+        "name": p["carrier"],
+        "status": p["display_status"],
+        "values": values,
+        "notes": _truncate_comment(p.get("comments"), 150) or "Declined to quote",
+    }
+
+
 def _build_property_carrier(p, is_internal=True):
     """Build carrier dict for property comparison table."""
-    is_declined = p["display_status"] in ("Declined", "Blocked", "Lost")
-    if is_declined:
-        values = {"Premium": "Declined"}
-        if is_internal and p["broker"] != "\u2014":
-            values["Broker"] = p["broker"]
-        comments = p.get("comments", "")
-        if isinstance(comments, str) and len(comments) > 150:
-            comments = comments[:147] + "..."
-        return {
-            "name": p["carrier"],
-            "status": p["display_status"],
-            "values": values,
-            "notes": comments if comments else "Declined to quote",
-        }
+    if p["display_status"] in DECLINED_STATUSES:
+        return _declined_carrier(p, is_internal)
     values = {
         "Premium": _safe_currency(p["premium_tx"]) if p["premium_tx"] else "Pending",
         "TIV": _safe_currency_int(p["tiv"]),
         "# of Locations": _safe_number(p["num_locs"]),
         "AOP Deductible": p["aop"],
-        "Wind": f"{p['wind']} ({p['wind_type']})" if p["wind"] != "\u2014" and p["wind_type"] != "\u2014" else p["wind"],
+        "Wind": f"{p['wind']} ({p['wind_type']})" if p["wind"] is not _DASH and p["wind_type"] is not _DASH else p["wind"],
         "AOW (All Other Wind)": p["aow"],
         "Water Damage": p["water_damage"],
     }
@@ -1113,19 +1611,19 @@ def _build_property_carrier(p, is_internal=True):
                 calc_rate = (p["base_premium"] / tiv_val) * 100
                 values["Property Rate"] = f"${calc_rate:.2f}"
             else:
-                values["Property Rate"] = "\u2014"
+                values["Property Rate"] = _DASH
         except (ValueError, TypeError):
-            values["Property Rate"] = "\u2014"
+            values["Property Rate"] = _DASH
     else:
-        values["Property Rate"] = "\u2014"
-    if p["property_limit"] != "\u2014":
+        values["Property Rate"] = _DASH
+    if p["property_limit"] is not _DASH:
         values["Property Limit"] = p["property_limit"]
-    if p["flood_limit"] != "\u2014":
+    if p["flood_limit"] is not _DASH:
         values["Flood Limit"] = p["flood_limit"]
-    if p["eq_limit"] != "\u2014":
+    if p["eq_limit"] is not _DASH:
         values["EQ Limit"] = p["eq_limit"]
     # Broker only on internal version
-    if is_internal and p["broker"] != "\u2014":
+    if is_internal and p["broker"] is not _DASH:
         values["Broker"] = p["broker"]
     if is_internal:
         if p["commission"]:
@@ -1133,19 +1631,24 @@ def _build_property_carrier(p, is_internal=True):
         if p["revenue"]:
             values["Revenue"] = _safe_currency(p["revenue"])
 
-    # Build notes from comments
-    comments = p.get("comments", "")
-    if isinstance(comments, str) and len(comments) > 100:
-        comments = comments[:97] + "..."
-
     return {
         "name": p["carrier"],
         "status": p["display_status"],
         "values": values,
-        "notes": comments if comments else "",
+        "notes": _truncate_comment(p.get("comments")),
     }
 
 
+def _keys_with_real_value(carriers_data, ignore=(_DASH,)):
+    """Metric keys for which at least one carrier has a value other than the placeholders in ignore."""
+    real = set()
+    for c in carriers_data:
+        for k, v in c["values"].items():
+            if v not in ignore:
+                real.add(k)
+    return real
+
+
 def _get_property_metrics(carriers_data, is_internal=True):
     """Determine which property metrics to show based on available data."""
     # Property Rate shown on both versions
@@ -1153,12 +1656,7 @@ def _get_property_metrics(carriers_data, is_internal=True):
     metrics.extend(["AOP Deductible", "Wind", "AOW (All Other Wind)", "Water Damage"])
 
     # Only add optional metrics if any carrier has data
-    all_values = {}
-    for c in carriers_data:
-        for k, v in c["values"].items():
-            if k not in all_values:
-                all_values[k] = []
-            all_values[k].append(v)
+    real = _keys_with_real_value(carriers_data)
 
     optional_metrics = ["Property Limit", "Flood Limit", "EQ Limit"]
     # Broker only on internal version
@@ -1168,30 +1666,15 @@ def _get_property_metrics(carriers_data, is_internal=True):
         optional_metrics.extend(["Commission", "Revenue"])
 
     for m in optional_metrics:
-        if m in all_values and any(v != "\u2014" for v in all_values[m]):
+        if m in real:
             metrics.append(m)
 
     return metrics
 
 
 def _build_gl_carrier(p, is_internal=True):
-    is_declined = p["display_status"] in ("Declined", "Blocked", "Lost")
-    if is_declined:
-        # For declined carriers, show minimal info with reason
-        values = {
-            "Premium": "Declined",
-        }
-        if is_internal and p["broker"] != "\u2014":
-            values["Broker"] = p["broker"]
-        comments = p.get("comments", "")
-        if isinstance(comments, str) and len(comments) > 150:
-            comments = comments[:147] + "..."
-        return {
-            "name": p["carrier"],
-            "status": p["display_status"],
-            "values": values,
-            "notes": comments if comments else "Declined to quote",
-        }
+    if p["display_status"] in DECLINED_STATUSES:
+        return _declined_carrier(p, is_internal)
 
     values = {
         "Premium": _safe_currency(p["premium_tx"]) if p["premium_tx"] else "Pending",
@@ -1208,7 +1691,7 @@ def _build_gl_carrier(p, is_internal=True):
         except (ValueError, TypeError):
             values["GL Rate"] = str(p["gl_rate"])
     else:
-        values["GL Rate"] = "\u2014"
+        values["GL Rate"] = _DASH
     if p["gl_rate_unit"]:
         try:
             gl_rate_unit_val = float(str(p["gl_rate_unit"]).replace("$", "").replace(",", ""))
@@ -1216,9 +1699,9 @@ def _build_gl_carrier(p, is_internal=True):
         except (ValueError, TypeError):
             values["GL Rate/Unit"] = str(p["gl_rate_unit"])
     else:
-        values["GL Rate/Unit"] = "\u2014"
+        values["GL Rate/Unit"] = _DASH
     # Broker only on internal version
-    if is_internal and p["broker"] != "\u2014":
+    if is_internal and p["broker"] is not _DASH:
         values["Broker"] = p["broker"]
     if is_internal:
         if p["commission"]:
@@ -1226,15 +1709,11 @@ def _build_gl_carrier(p, is_internal=True):
         if p["revenue"]:
             values["Revenue"] = _safe_currency(p["revenue"])
 
-    comments = p.get("comments", "")
-    if isinstance(comments, str) and len(comments) > 100:
-        comments = comments[:97] + "..."
-
     return {
         "name": p["carrier"],
         "status": p["display_status"],
         "values": values,
-        "notes": comments if comments else "",
+        "notes": _truncate_comment(p.get("comments")),
     }
 
 
@@ -1242,37 +1721,20 @@ def _get_gl_metrics(carriers_data, is_internal=True):
     # GL rates shown on both versions
     metrics = ["Premium", "# of Units", "Total Sales", "GL Rate", "GL Rate/Unit"]
     metrics.extend(["GL Deductible", "# of Locations"])
-    all_values = {}
-    for c in carriers_data:
-        for k, v in c["values"].items():
-            if k not in all_values:
-                all_values[k] = []
-            all_values[k].append(v)
+    real = _keys_with_real_value(carriers_data)
     # Broker only on internal version
     if is_internal:
-        if "Broker" in all_values and any(v != "\u2014" for v in all_values["Broker"]):
+        if "Broker" in real:
             metrics.append("Broker")
         for m in ["Commission", "Revenue"]:
-            if m in all_values and any(v != "\u2014" for v in all_values[m]):
+            if m in real:
                 metrics.append(m)
     return metrics
 
 
 def _build_umbrella_carrier(p, is_internal=True):
-    is_declined = p["display_status"] in ("Declined", "Blocked", "Lost")
-    if is_declined:
-        values = {"Premium": "Declined"}
-        if is_internal and p["broker"] != "\u2014":
-            values["Broker"] = p["broker"]
-        comments = p.get("comments", "")
-        if isinstance(comments, str) and len(comments) > 150:
-            comments = comments[:147] + "..."
-        return {
-            "name": p["carrier"],
-            "status": p["display_status"],
-            "values": values,
-            "notes": comments if comments else "Declined to quote",
-        }
+    if p["display_status"] in DECLINED_STATUSES:
+        return _declined_carrier(p, is_internal)
     values = {
         "Premium": _safe_currency(p["premium_tx"]) if p["premium_tx"] else "Pending",
         "# of Units": _safe_number(p["units"]),
@@ -1295,7 +1757,7 @@ def _build_umbrella_carrier(p, is_internal=True):
         except (ValueError, TypeError, ZeroDivisionError):
             pass
     # Broker only on internal version
-    if is_internal and p["broker"] != "\u2014":
+    if is_internal and p["broker"] is not _DASH:
         values["Broker"] = p["broker"]
     if is_internal:
         if p["commission"]:
@@ -1303,61 +1765,40 @@ def _build_umbrella_carrier(p, is_internal=True):
         if p["revenue"]:
             values["Revenue"] = _safe_currency(p["revenue"])
 
-    comments = p.get("comments", "")
-    if isinstance(comments, str) and len(comments) > 100:
-        comments = comments[:97] + "..."
-
     return {
         "name": p["carrier"],
         "status": p["display_status"],
         "values": values,
-        "notes": comments if comments else "",
+        "notes": _truncate_comment(p.get("comments")),
     }
 
 
 def _get_umbrella_metrics(carriers_data, is_internal=True):
     metrics = ["Premium", "# of Units", "# of Locations", "Umbrella Limit", "Total Sales"]
-    all_values = {}
-    for c in carriers_data:
-        for k, v in c["values"].items():
-            if k not in all_values:
-                all_values[k] = []
-            all_values[k].append(v)
+    real = _keys_with_real_value(carriers_data)
     # Rate metrics
     for m in ["Rate/Unit", "Rate/$1K Sales"]:
-        if m in all_values and any(v != "\u2014" for v in all_values.get(m, [])):
+        if m in real:
             metrics.append(m)
     # Broker only on internal version
     if is_internal:
-        if "Broker" in all_values and any(v != "\u2014" for v in all_values["Broker"]):
+        if "Broker" in real:
             metrics.append("Broker")
         for m in ["Commission", "Revenue"]:
-            if m in all_values and any(v != "\u2014" for v in all_values[m]):
+            if m in real:
                 metrics.append(m)
     return metrics
 
 
 def _build_wc_carrier(p, is_internal=True):
-    is_declined = p["display_status"] in ("Declined", "Blocked", "Lost")
-    if is_declined:
-        values = {"Premium": "Declined"}
-        if is_internal and p["broker"] != "\u2014":
-            values["Broker"] = p["broker"]
-        comments = p.get("comments", "")
-        if isinstance(comments, str) and len(comments) > 150:
-            comments = comments[:147] + "..."
-        return {
-            "name": p["carrier"],
-            "status": p["display_status"],
-            "values": values,
-            "notes": comments if comments else "Declined to quote",
-        }
+    if p["display_status"] in DECLINED_STATUSES:
+        return _declined_carrier(p, is_internal)
     values = {
         "Premium": _safe_currency(p["premium_tx"]) if p["premium_tx"] else "Pending",
         "Total Payroll": _safe_currency_int(p["total_payroll"]),
     }
     # Broker only on internal version
-    if is_internal and p["broker"] != "\u2014":
+    if is_internal and p["broker"] is not _DASH:
         values["Broker"] = p["broker"]
     if p["exp_mod"]:
         try:
@@ -1376,55 +1817,39 @@ def _build_wc_carrier(p, is_internal=True):
         if p["revenue"]:
             values["Revenue"] = _safe_currency(p["revenue"])
 
-    comments = p.get("comments", "")
-    if isinstance(comments, str) and len(comments) > 100:
-        comments = comments[:97] + "..."
-
     return {
         "name": p["carrier"],
         "status": p["display_status"],
         "values": values,
-        "notes": comments if comments else "",
+        "notes": _truncate_comment(p.get("comments")),
     }
 
 
+# WC credit values that don't justify showing the row
+_NO_CREDIT_VALUES = frozenset({_DASH, "No"})
+
+
 def _get_wc_metrics(carriers_data, is_internal=True):
     metrics = ["Premium", "Total Payroll"]
-    all_values = {}
-    for c in carriers_data:
-        for k, v in c["values"].items():
-            if k not in all_values:
-                all_values[k] = []
-            all_values[k].append(v)
+    real = _keys_with_real_value(carriers_data)
+    credited = _keys_with_real_value(carriers_data, ignore=_NO_CREDIT_VALUES)
     for m in ["Exp Mod", "Safety Credit", "Drug Free Credit"]:
-        if m in all_values and any(v not in ("\u2014", "No") for v in all_values[m]):
+        if m in credited:
             metrics.append(m)
     # Broker only on internal version
     if is_internal:
-        if "Broker" in all_values and any(v != "\u2014" for v in all_values["Broker"]):
+        if "Broker" in real:
             metrics.append("Broker")
         for m in ["Commission", "Revenue"]:
-            if m in all_values and any(v != "\u2014" for v in all_values[m]):
+            if m in real:
                 metrics.append(m)
     return metrics
 
 
 def _build_generic_carrier(p, is_internal=True):
     """Generic carrier builder for EPLI, Cyber, Flood, Auto, etc."""
-    is_declined = p["display_status"] in ("Declined", "Blocked", "Lost")
-    if is_declined:
-        values = {"Premium": "Declined"}
-        if is_internal and p["broker"] != "\u2014":
-            values["Broker"] = p["broker"]
-        comments = p.get("comments", "")
-        if isinstance(comments, str) and len(comments) > 150:
-            comments = comments[:147] + "..."
-        return {
-            "name": p["carrier"],
-            "status": p["display_status"],
-            "values": values,
-            "notes": comments if comments else "Declined to quote",
-        }
+    if p["display_status"] in DECLINED_STATUSES:
+        return _declined_carrier(p, is_internal)
     values = {
         "Premium": _safe_currency(p["premium_tx"]) if p["premium_tx"] else "Pending",
     }
@@ -1436,12 +1861,12 @@ def _build_generic_carrier(p, is_internal=True):
     # Coverage-specific fields
     ct = p["coverage_type"]
     if ct == "Flood":
-        if p["flood_limit"] != "\u2014":
+        if p["flood_limit"] is not _DASH:
             values["Flood Limit"] = p["flood_limit"]
-        if p["flood_deductible"] != "\u2014":
+        if p["flood_deductible"] is not _DASH:
             values["Flood Deductible"] = p["flood_deductible"]
     elif ct == "Employment Practices Liability":
-        if p["umb_limit"] != "\u2014":
+        if p["umb_limit"] is not _DASH:
             values["Limit"] = p["umb_limit"]
     elif ct == "Cyber":
         # Cyber Liability: include Gross Sales
@@ -1449,7 +1874,7 @@ def _build_generic_carrier(p, is_internal=True):
             values["Gross Sales"] = _safe_currency_int(p["gross_sales"])
 
     # Broker only on internal version
-    if is_internal and p["broker"] != "\u2014":
+    if is_internal and p["broker"] is not _DASH:
         values["Broker"] = p["broker"]
 
     if is_internal:
@@ -1458,26 +1883,17 @@ def _build_generic_carrier(p, is_internal=True):
         if p["revenue"]:
             values["Revenue"] = _safe_currency(p["revenue"])
 
-    comments = p.get("comments", "")
-    if isinstance(comments, str) and len(comments) > 100:
-        comments = comments[:97] + "..."
-
     return {
         "name": p["carrier"],
         "status": p["display_status"],
         "values": values,
-        "notes": comments if comments else "",
+        "notes": _truncate_comment(p.get("comments")),
     }
 
 
 def _get_generic_metrics(carriers_data, is_internal=True):
     metrics = ["Premium"]
-    all_values = {}
-    for c in carriers_data:
-        for k, v in c["values"].items():
-            if k not in all_values:
-                all_values[k] = []
-            all_values[k].append(v)
+    real = _keys_with_real_value(carriers_data)
     # Add metrics that have data (available on all versions)
     optional = ["# of Units", "# of Locations", "Gross Sales", "Limit", "Flood Limit", "Flood Deductible",
                 "Building Limit", "BPP Limit", "Retention"]
@@ -1485,12 +1901,12 @@ def _get_generic_metrics(carriers_data, is_internal=True):
     if is_internal:
         optional.append("Broker")
     for m in optional:
-        if m in all_values and any(v != "\u2014" for v in all_values[m]):
+        if m in real:
             metrics.append(m)
     # Internal-only metrics
     if is_internal:
         for m in ["Commission", "Revenue"]:
-            if m in all_values and any(v != "\u2014" for v in all_values[m]):
+            if m in real:
                 metrics.append(m)
     return metrics
 
@@ -1506,61 +1922,49 @@ def _build_property_tower(policies, is_internal=True):
     if len(incumbents) <= 1:
         return None  # No tower needed
 
-    tower_prem = sum(p["premium_tx"] for p in incumbents)
-    # TIV is the same across all carriers in the tower (shared exposure)
+    # One pass over the tower: premium/revenue totals, shared TIV (max across carriers, since
+    # it is the same exposure), the largest of each limit, and whether commissions differ
+    tower_prem = tower_base_prem = total_rev = 0
     tower_tiv = 0
+    max_limits = dict.fromkeys(("property_limit", "flood_limit", "eq_limit"), 0)
+    comm = incumbents[0]["commission"]
+    all_same = True
     for p in incumbents:
+        tower_prem += p["premium_tx"]
+        tower_base_prem += p["base_premium"]
+        total_rev += p["revenue"]
+        if p["commission"] != comm:
+            all_same = False
         if p["tiv"]:
-            try:
-                tiv_val = float(str(p["tiv"]).replace("$", "").replace(",", ""))
-                if tiv_val > tower_tiv:
-                    tower_tiv = tiv_val
-            except (ValueError, TypeError):
-                pass
+            tiv_val = _coerce_float(p["tiv"])
+            if tiv_val is not None and tiv_val > tower_tiv:
+                tower_tiv = tiv_val
+        for key, current in max_limits.items():
+            limit = _parse_limit(p.get(key))
+            if limit is not None and limit > current:
+                max_limits[key] = limit
     # Blended rate = combined base premium / TIV * 100 (rate per $100)
-    tower_base_prem = sum(p["base_premium"] for p in incumbents)
     blended_rate = (tower_base_prem / tower_tiv * 100) if tower_tiv > 0 and tower_base_prem > 0 else 0
 
-    # Get max limits
-    def _max_limit(pols, key):
-        vals = []
-        for p in pols:
-            v = p.get(key, "\u2014")
-            if v and v != "\u2014":
-                try:
-                    clean = str(v).replace("$", "").replace(",", "").replace("M", "000000").replace("k", "000")
-                    vals.append(float(clean))
-                except (ValueError, TypeError):
-                    pass
-        return _fmt_limit(str(int(max(vals)))) if vals else "\u2014"
-
     values = {
         "Premium": _safe_currency(tower_prem),
         "TIV": _safe_currency_int(tower_tiv),
         "# of Locations": _safe_number(incumbents[0]["num_locs"]),
         "AOP Deductible": incumbents[0]["aop"],
-        "Wind": f"{incumbents[0]['wind']} ({incumbents[0]['wind_type']})" if incumbents[0]["wind"] != "\u2014" else "\u2014",
+        "Wind": f"{incumbents[0]['wind']} ({incumbents[0]['wind_type']})" if incumbents[0]["wind"] is not _DASH else _DASH,
         "AOW (All Other Wind)": incumbents[0]["aow"],
         "Water Damage": incumbents[0]["water_damage"],
     }
     # Property rate on both versions
-    values["Property Rate"] = f"${blended_rate:.2f}" if blended_rate else "\u2014"
-    prop_limit = _max_limit(incumbents, "property_limit")
-    if prop_limit != "\u2014":
-        values["Property Limit"] = prop_limit
-    flood_limit = _max_limit(incumbents, "flood_limit")
-    if flood_limit != "\u2014":
-        values["Flood Limit"] = flood_limit
-    eq_limit = _max_limit(incumbents, "eq_limit")
-    if eq_limit != "\u2014":
-        values["EQ Limit"] = eq_limit
+    values["Property Rate"] = f"${blended_rate:.2f}" if blended_rate else _DASH
+    for key, label in (("property_limit", "Property Limit"), ("flood_limit", "Flood Limit"),
+                       ("eq_limit", "EQ Limit")):
+        if max_limits[key]:
+            values[label] = _fmt_limit(int(max_limits[key]))
     # Broker only on internal version
-    if is_internal and incumbents[0]["broker"] != "\u2014":
+    if is_internal and incumbents[0]["broker"] is not _DASH:
         values["Broker"] = incumbents[0]["broker"]
     if is_internal:
-        total_rev = sum(p["revenue"] for p in incumbents if p["revenue"])
-        comm = incumbents[0]["commission"]
-        all_same = all(p["commission"] == comm for p in incumbents)
         if comm:
             values["Commission"] = _safe_percent(comm) + ("" if all_same else " (blended)")
         if total_rev:
@@ -1588,24 +1992,22 @@ def _build_umbrella_tower(policies, is_internal=True):
     for i, p in enumerate(incumbents):
         layer = layer_names[i] if i < len(layer_names) else f"{i+1}th Excess"
         tower_desc.append(f"{p['carrier']} ({p['umb_limit']} {layer})")
-        try:
-            clean = str(p["umb_limit"]).replace("$", "").replace(",", "").replace("M", "000000").replace("k", "000")
-            total_limit += float(clean)
-        except (ValueError, TypeError):
-            pass
+        limit = _parse_limit(p["umb_limit"])
+        if limit:
+            total_limit += limit
 
     values = {
         "Premium": _safe_currency(tower_prem),
         "# of Units": _safe_number(incumbents[0]["units"]),
         "# of Locations": _safe_number(incumbents[0]["num_locs"]),
-        "Umbrella Limit": _fmt_limit(str(int(total_limit))) + " (combined)" if total_limit else "\u2014",
+        "Umbrella Limit": _fmt_limit(int(total_limit)) + " (combined)" if total_limit else _DASH,
         "Total Sales": _safe_currency_int(incumbents[0]["gross_sales"]),
     }
     # Broker only on internal version
-    if is_internal and incumbents[0]["broker"] != "\u2014":
+    if is_internal and incumbents[0]["broker"] is not _DASH:
         values["Broker"] = incumbents[0]["broker"]
     if is_internal:
-        total_rev = sum(p["revenue"] for p in incumbents if p["revenue"])
+        total_rev = sum(p["revenue"] for p in incumbents)
         if incumbents[0]["commission"]:
             values["Commission"] = _safe_percent(incumbents[0]["commission"])
         if total_rev:
@@ -1619,23 +2021,30 @@ def _build_umbrella_tower(policies, is_internal=True):
     }
 
 
-def _add_internal_detail_pages(doc, by_coverage, parsed_policies):
+def _add_internal_detail_pages(doc, by_coverage, parsed_policies, status_buckets=None):
     """Add internal-only detail pages for Property Tower, Umbrella Tower, and GL Detail."""
-    has_detail = False
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    no_bucket = {"incumbent": ()}
+    prop_incumbents = status_buckets.get("Property", no_bucket)["incumbent"]
+    umb_incumbents = status_buckets.get("Umbrella", no_bucket)["incumbent"]
+    gl_policies = by_coverage.get("Liability", [])
 
-    # Property Carrier Detail
-    prop_policies = by_coverage.get("Property", [])
-    incumbents = sorted([p for p in prop_policies if p["status"] == "Incumbent"],
-                        key=lambda x: x["premium_tx"], reverse=True)
-    if len(incumbents) > 1:
-        if not has_detail:
-            add_page_break(doc)
-            add_section_header(doc, "Internal Detail Pages")
-            add_callout_box(doc, "The following pages are for internal use only and should not be shared with the client.",
-                           size=10, shading_hex="FDE8E8")
-            has_detail = True
+    need_property = len(prop_incumbents) > 1
+    need_umb = len(umb_incumbents) > 1
+    need_gl = len(gl_policies) > 2
+    if not (need_property or need_umb or need_gl):
+        return False
+
+    add_page_break(doc)
+    add_section_header(doc, "Internal Detail Pages")
+    add_callout_box(doc, "The following pages are for internal use only and should not be shared with the client.",
+                   size=10, shading_hex="FDE8E8")
 
-        add_formatted_paragraph(doc, "", size=6, space_before=0, space_after=0)
+    # Property Carrier Detail
+    if need_property:
+        incumbents = sorted(prop_incumbents, key=lambda x: x["premium_tx"], reverse=True)
+        add_spacer(doc, 6)
         add_subsection_header(doc, "Property Carrier Detail (Expiring Tower)")
         add_formatted_paragraph(doc,
             "The following table breaks out each individual carrier within the expiring property placement tower.",
@@ -1651,18 +2060,15 @@ def _add_internal_detail_pages(doc, by_coverage, parsed_policies):
 
         metrics = ["Base Premium", "Premium"] + _get_property_metrics(tower_carriers, is_internal=True)
         # Remove duplicates while preserving order
-        seen = set()
-        unique_metrics = []
-        for m in metrics:
-            if m not in seen:
-                seen.add(m)
-                unique_metrics.append(m)
+        unique_metrics = list(dict.fromkeys(metrics))
         create_carrier_comparison_table(doc, "Property Tower Detail", unique_metrics, tower_carriers)
 
         # Add totals note
-        total_base = sum(p["base_premium"] for p in incumbents)
-        total_prem = sum(p["premium_tx"] for p in incumbents)
-        total_rev = sum(p["revenue"] for p in incumbents if p["revenue"])
+        total_base = total_prem = total_rev = 0
+        for p in incumbents:
+            total_base += p["base_premium"]
+            total_prem += p["premium_tx"]
+            total_rev += p["revenue"]
         add_callout_box(doc,
             f"Tower Totals: Base Premium {_safe_currency(total_base)} | "
             f"Premium w/ Tax {_safe_currency(total_prem)} | "
@@ -1670,17 +2076,8 @@ def _add_internal_detail_pages(doc, by_coverage, parsed_policies):
             size=9)
 
     # Umbrella Tower Detail
-    umb_policies = by_coverage.get("Umbrella", [])
-    umb_incumbents = sorted([p for p in umb_policies if p["status"] == "Incumbent"],
-                            key=lambda x: x["premium_tx"], reverse=True)
-    if len(umb_incumbents) > 1:
-        if not has_detail:
-            add_page_break(doc)
-            add_section_header(doc, "Internal Detail Pages")
-            add_callout_box(doc, "The following pages are for internal use only and should not be shared with the client.",
-                           size=10, shading_hex="FDE8E8")
-            has_detail = True
-
+    if need_umb:
+        umb_incumbents = sorted(umb_incumbents, key=lambda x: x["premium_tx"], reverse=True)
         add_page_break(doc)
         add_subsection_header(doc, "Umbrella Tower Detail (Expiring)")
 
@@ -1695,25 +2092,14 @@ def _add_internal_detail_pages(doc, by_coverage, parsed_policies):
 
         metrics = ["Base Premium", "Premium", "Umbrella Limit", "# of Units", "Rate/Unit", "Broker", "Commission", "Revenue"]
         # Filter to only metrics that exist
-        all_vals = {}
+        present_keys = set()
         for c in tower_carriers:
-            for k, v in c["values"].items():
-                if k not in all_vals:
-                    all_vals[k] = []
-                all_vals[k].append(v)
-        metrics = [m for m in metrics if m in all_vals]
+            present_keys.update(c["values"])
+        metrics = [m for m in metrics if m in present_keys]
         create_carrier_comparison_table(doc, "Umbrella Tower Detail", metrics, tower_carriers)
 
     # GL Quoted Detail (if more than 2 GL policies)
-    gl_policies = by_coverage.get("Liability", [])
-    if len(gl_policies) > 2:
-        if not has_detail:
-            add_page_break(doc)
-            add_section_header(doc, "Internal Detail Pages")
-            add_callout_box(doc, "The following pages are for internal use only and should not be shared with the client.",
-                           size=10, shading_hex="FDE8E8")
-            has_detail = True
-
+    if need_gl:
         add_page_break(doc)
         add_subsection_header(doc, "GL Quoted Detail")
 
@@ -1726,51 +2112,186 @@ def _add_internal_detail_pages(doc, by_coverage, parsed_policies):
 
         metrics = ["Status", "Base Premium", "Premium", "Total Sales", "GL Rate", "GL Rate/Unit",
                    "# of Units", "Broker", "Commission", "Revenue"]
-        all_vals = {}
+        present_keys = set()
         for c in gl_carriers:
-            for k, v in c["values"].items():
-                if k not in all_vals:
-                    all_vals[k] = []
-                all_vals[k].append(v)
-        metrics = [m for m in metrics if m in all_vals]
+            present_keys.update(c["values"])
+        metrics = [m for m in metrics if m in present_keys]
         create_carrier_comparison_table(doc, "GL Detail", metrics, gl_carriers)
 
-    return has_detail
+    return True
+
 
+def _build_client_umbrella_tower(policies, is_internal=True):
+    """Umbrella tower column for the client version only; internal shows each layer's carrier."""
+    if is_internal:
+        return None
+    return _build_umbrella_tower(policies, is_internal=is_internal)
 
-# Coverage type -> (carrier_builder, metrics_builder) mapping
+
+# Coverage type -> (carrier_builder, metrics_builder, tower_builder or None) mapping.
+# A tower builder returns a combined column for multi-carrier incumbents, or None.
 COVERAGE_BUILDERS = {
-    "Property": (_build_property_carrier, _get_property_metrics),
-    "Liability": (_build_gl_carrier, _get_gl_metrics),
-    "Umbrella": (_build_umbrella_carrier, _get_umbrella_metrics),
-    "Workers Compensation": (_build_wc_carrier, _get_wc_metrics),
+    "Property": (_build_property_carrier, _get_property_metrics, _build_property_tower),
+    "Liability": (_build_gl_carrier, _get_gl_metrics, None),
+    "Umbrella": (_build_umbrella_carrier, _get_umbrella_metrics, _build_client_umbrella_tower),
+    "Workers Compensation": (_build_wc_carrier, _get_wc_metrics, None),
 }
+_GENERIC_BUILDERS = (_build_generic_carrier, _get_generic_metrics, None)
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# CARRIER COMPARISON SECTIONS
+# ══════════════════════════════════════════════════════════════════════════
+
+# Page budget for packing comparison sections, in units of one comparison metric row:
+# 3pt before + 12pt exact line + 3pt after (see create_carrier_comparison_table).
+# Carriers are columns, so a section's height is driven by its metric count.
+COMPARISON_ROW_PT = 3 + 12 + 3
+# Letter body height: 11in less the 1.2in top and 0.6in bottom margins set in
+# generate_marketing_update_docx = 662.4pt, i.e. 36 full rows.
+COMPARISON_ROWS_PER_PAGE = int((11 - 1.2 - 0.6) * 72 // COMPARISON_ROW_PT)
+# Opening the first comparison page: "Carrier Comparisons" header (24 before + 25 line + 12 after),
+# the two-line 10pt legend callout (6 + 2 x ~12.2 + 6) and a 6pt spacer (9pt line) = ~106pt.
+COMPARISON_PAGE_HEADER_ROWS = math.ceil(((24 + 25 + 12) + (6 + 2 * 12.2 + 6) + 9) / COMPARISON_ROW_PT)
+# Per section besides its metric rows: subsection header (14 before + 17 line + 6 after),
+# the two-line table header row (4 + 12 + 1, then 10 + 3) and the closing 8pt spacer (11pt) = 78pt.
+COMPARISON_SECTION_OVERHEAD_ROWS = math.ceil(((14 + 17 + 6) + (4 + 12 + 1 + 10 + 3) + 11) / COMPARISON_ROW_PT)
+
+
+def _declined_line(dc):
+    """Bulleted declined-market line: "• Carrier Name (via Broker) — reason"."""
+    broker = dc.get("values", {}).get("Broker", "")
+    broker_part = f" (via {broker})" if broker else ""
+    notes = dc.get("notes", "")
+    if not notes or notes == "Declined to quote":
+        return f"\u2022 {dc['name']}{broker_part}"
+    if len(notes) > 100:
+        notes = notes[:100] + "..."
+    return f"\u2022 {dc['name']}{broker_part} \u2014 {notes}"
+
+
+@dataclass
+class LazyCoverageTable:
+    """
+    Deferred carrier comparison section for one coverage line.
+    Carrier dicts and metrics are only built when the section is actually emitted.
+    """
+    coverage_type: str
+    policies: list
+    is_internal: bool = True
+
+    @cached_property
+    def carriers_data(self):
+        ct = self.coverage_type
+        policies = self.policies
+        is_internal = self.is_internal
+        builder_func, _, tower_func = COVERAGE_BUILDERS.get(ct, _GENERIC_BUILDERS)
+
+        # Multi-carrier incumbents collapse into one tower column; everyone else stays individual
+        tower = tower_func(policies, is_internal=is_internal) if tower_func else None
+        if tower:
+            carriers_data = [tower]
+            carriers_data.extend(builder_func(p, is_internal=is_internal)
+                                 for p in policies if p["status"] != "Incumbent")
+        else:
+            carriers_data = [builder_func(p, is_internal=is_internal) for p in policies]
+
+        return carriers_data
+
+    @cached_property
+    def _split_carriers(self):
+        """(active, declined) carriers, partitioned in one pass."""
+        active, declined = [], []
+        for c in self.carriers_data:
+            (declined if c["status"] in DECLINED_STATUSES else active).append(c)
+        return active, declined
+
+    @property
+    def declined_carriers(self):
+        return self._split_carriers[1]
+
+    @property
+    def table_carriers(self):
+        """Active carriers for the main table (or all if none are active)."""
+        active_carriers = self._split_carriers[0]
+        return active_carriers if active_carriers else self.carriers_data
+
+    @cached_property
+    def metrics(self):
+        _, metrics_func, _ = COVERAGE_BUILDERS.get(self.coverage_type, _GENERIC_BUILDERS)
+        return metrics_func(self.table_carriers, is_internal=self.is_internal)
+
+    @property
+    def row_estimate(self):
+        """
+        Approximate height in comparison rows: header/table-header/spacer overhead, metric rows,
+        a possibly wrapped notes row, and one row per declined-market line (slightly generous,
+        so estimates err toward breaking early rather than overflowing).
+        """
+        rows = COMPARISON_SECTION_OVERHEAD_ROWS + len(self.metrics)
+        if any(c.get("notes") for c in self.table_carriers):
+            rows += 2
+        if self.declined_carriers:
+            rows += 1 + len(self.declined_carriers)
+        return rows
+
+    def render(self, doc):
+        ct = self.coverage_type
+        add_subsection_header(doc, COVERAGE_DISPLAY_NAMES.get(ct, ct))
+        create_carrier_comparison_table(doc, COVERAGE_SHORT.get(ct, ct), self.metrics, self.table_carriers)
+
+        # Show declined carriers as a clean note below the table
+        declined_carriers = self.declined_carriers
+        if declined_carriers:
+            p_label = doc.add_paragraph()
+            p_label.paragraph_format.space_before = _PT[4]
+            p_label.paragraph_format.space_after = _PT[1]
+            p_label.paragraph_format.left_indent = _IN[0.1]
+            run_label = p_label.add_run("Declined Markets:")
+            run_label.font.size = _PT[8]
+            run_label.font.color.rgb = MUTED_GRAY
+            run_label.font.bold = True
+            run_label.font.italic = True
+            run_label.font.name = "Calibri"
+
+            for dc in declined_carriers:
+                p_dc = doc.add_paragraph()
+                p_dc.paragraph_format.space_before = _PT[0]
+                p_dc.paragraph_format.space_after = _PT[1]
+                p_dc.paragraph_format.left_indent = _IN[0.25]
+                run_dc = p_dc.add_run(_declined_line(dc))
+                run_dc.font.size = _PT[7.5]
+                run_dc.font.color.rgb = MUTED_GRAY
+                run_dc.font.italic = True
+                run_dc.font.name = "Calibri"
+
+        add_spacer(doc, 8)
 
 
 # ══════════════════════════════════════════════════════════════════════════
 # PREMIUM COMPARISON DATA BUILDER
 # ══════════════════════════════════════════════════════════════════════════
 
-def build_premium_comparison(by_coverage, parsed_policies):
+def build_premium_comparison(by_coverage, parsed_policies, status_buckets=None, sorted_display=None):
     """Build premium comparison rows: Coverage | Carrier | Expiring | Proposed | $ Change | % Change."""
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
     rows = []
     total_expiring = 0
     total_proposed = 0
     pending_coverages = []
 
-    sorted_coverages = sorted(by_coverage.keys(), key=_coverage_sort_key)
-
-    for ct in sorted_coverages:
+    for ct, display_name in sorted_display:
         policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
 
-        # Find expiring (Incumbent) and proposed/bound
-        expiring = [p for p in policies if p["status"] == "Incumbent"]
-        bound = [p for p in policies if p["status"] in ("Bound", "Proposed")]
-        quoted = [p for p in policies if p["status"] == "Quoted"]
-
-        expiring_premium = sum(p["premium_tx"] for p in expiring) if expiring else 0
-        proposed_premium = sum(p["premium_tx"] for p in bound) if bound else 0
+        # Expiring (Incumbent) and proposed/bound policies with their premium totals
+        b = status_buckets[ct]
+        expiring, bound, quoted = b["incumbent"], b["bound"], b["quoted"]
+        expiring_premium = b["incumbent_premium"]
+        proposed_premium = b["bound_premium"]
+        is_included = b["bundled"]
 
         # Determine carrier name for the row
         if bound:
@@ -1780,83 +2301,70 @@ def build_premium_comparison(by_coverage, parsed_policies):
         elif expiring:
             carrier_name = expiring[0]["carrier"]
         else:
-            carrier_name = policies[0]["carrier"] if policies else "—"
-
-        # Check if this is a "bundled" coverage (e.g., EPLI included in GL)
-        is_included = False
-        for p in policies:
-            comments = str(p.get("comments", "")).lower()
-            if "included" in comments or "inc " in comments[:10]:
-                is_included = True
-                break
+            carrier_name = policies[0]["carrier"] if policies else _DASH
 
         # Always add expiring premium to total regardless of proposed status
         if expiring_premium:
             total_expiring += expiring_premium
 
+        exp_str = _safe_currency(expiring_premium) if expiring_premium else _DASH
         if proposed_premium > 0:
-            exp_str = _safe_currency(expiring_premium) if expiring_premium else "\u2014"
             prop_str = _safe_currency(proposed_premium)
+            total_proposed += proposed_premium
             if expiring_premium > 0:
                 change = proposed_premium - expiring_premium
-                pct_change = (change / expiring_premium) * 100
-                change_str = f"+${change:,.0f}" if change > 0 else f"-${abs(change):,.0f}"
-                pct_str = f"+{pct_change:.1f}%" if change > 0 else f"{pct_change:.1f}%"
-                total_proposed += proposed_premium
+                change_str = _fmt_signed_money(change)
+                pct_str = _fmt_signed_pct(change / expiring_premium * 100)
             else:
-                change_str = "\u2014"
-                pct_str = "\u2014"
-                total_proposed += proposed_premium
+                change_str = pct_str = _DASH
             rows.append([display_name, carrier_name, exp_str, prop_str, change_str, pct_str])
         elif is_included:
-            exp_str = "\u2014" if not expiring_premium else _safe_currency(expiring_premium)
-            rows.append([display_name, "Included in GL", exp_str, "Included", "\u2014", "\u2014"])
+            rows.append([display_name, "Included in GL", exp_str, "Included", _DASH, _DASH])
         else:
-            exp_str = _safe_currency(expiring_premium) if expiring_premium else "\u2014"
             pending_coverages.append(display_name)
-            rows.append([display_name, carrier_name, exp_str, "Pending", "\u2014", "\u2014"])
+            rows.append([display_name, carrier_name, exp_str, "Pending", _DASH, _DASH])
 
     # Total row
     total_change = total_proposed - total_expiring if total_expiring > 0 else 0
     total_pct = (total_change / total_expiring * 100) if total_expiring > 0 else 0
-    total_change_str = f"+${total_change:,.0f}" if total_change > 0 else f"-${abs(total_change):,.0f}" if total_change != 0 else "\u2014"
-    total_pct_str = f"+{total_pct:.1f}%" if total_change > 0 else f"{total_pct:.1f}%" if total_change != 0 else "\u2014"
+    total_change_str = _fmt_signed_money(total_change)
+    total_pct_str = _fmt_signed_pct(total_pct)
 
     rows.append([
         "TOTAL", "",
-        _safe_currency(total_expiring) if total_expiring else "\u2014",
-        _safe_currency(total_proposed) if total_proposed else "\u2014",
+        _safe_currency(total_expiring) if total_expiring else _DASH,
+        _safe_currency(total_proposed) if total_proposed else _DASH,
         total_change_str, total_pct_str,
     ])
 
     return rows, total_change, total_pct, pending_coverages
 
 
-def build_premium_comparison_internal(by_coverage, parsed_policies):
+def build_premium_comparison_internal(by_coverage, parsed_policies, status_buckets=None, sorted_display=None):
     """Build internal premium comparison with Commission and Revenue columns."""
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
     rows = []
     total_expiring = 0
     total_proposed = 0
     total_commission_revenue = 0
     pending_coverages = []
 
-    sorted_coverages = sorted(by_coverage.keys(), key=_coverage_sort_key)
-
-    for ct in sorted_coverages:
+    for ct, display_name in sorted_display:
         policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
 
-        expiring = [p for p in policies if p["status"] == "Incumbent"]
-        bound = [p for p in policies if p["status"] in ("Bound", "Proposed")]
-        quoted = [p for p in policies if p["status"] == "Quoted"]
-
-        expiring_premium = sum(p["premium_tx"] for p in expiring) if expiring else 0
-        proposed_premium = sum(p["premium_tx"] for p in bound) if bound else 0
+        b = status_buckets[ct]
+        expiring, bound, quoted = b["incumbent"], b["bound"], b["quoted"]
+        expiring_premium = b["incumbent_premium"]
+        proposed_premium = b["bound_premium"]
+        is_included = b["bundled"]
 
         # Get commission and revenue from bound/proposed carrier
-        comm_str = "—"
-        rev_str = "—"
-        broker_str = "—"
+        comm_str = _DASH
+        rev_str = _DASH
+        broker_str = _DASH
         if bound:
             if len(bound) > 1:
                 carrier_name = f"{len(bound)}-Carrier Placement"
@@ -1864,7 +2372,7 @@ def build_premium_comparison_internal(by_coverage, parsed_policies):
                 carrier_name = bound[0]["carrier"]
             if bound[0]["commission"]:
                 comm_str = _safe_percent(bound[0]["commission"])
-            total_rev = sum(p["revenue"] for p in bound if p["revenue"])
+            total_rev = sum(p["revenue"] for p in bound)
             if total_rev:
                 rev_str = _safe_currency(total_rev)
                 total_commission_revenue += total_rev
@@ -1884,53 +2392,41 @@ def build_premium_comparison_internal(by_coverage, parsed_policies):
                 carrier_name = expiring[0]["carrier"]
                 broker_str = expiring[0]["broker"]
         else:
-            carrier_name = policies[0]["carrier"] if policies else "—"
-
-        is_included = False
-        for p in policies:
-            comments = str(p.get("comments", "")).lower()
-            if "included" in comments or "inc " in comments[:10]:
-                is_included = True
-                break
+            carrier_name = policies[0]["carrier"] if policies else _DASH
 
         # Always add expiring premium to total regardless of proposed status
         if expiring_premium:
             total_expiring += expiring_premium
 
+        exp_str = _safe_currency(expiring_premium) if expiring_premium else _DASH
         if proposed_premium > 0:
-            exp_str = _safe_currency(expiring_premium) if expiring_premium else "\u2014"
             prop_str = _safe_currency(proposed_premium)
+            total_proposed += proposed_premium
             if expiring_premium > 0:
                 change = proposed_premium - expiring_premium
-                pct_change = (change / expiring_premium) * 100
-                change_str = f"+${change:,.0f}" if change > 0 else f"-${abs(change):,.0f}"
-                pct_str = f"+{pct_change:.1f}%" if change > 0 else f"{pct_change:.1f}%"
-                total_proposed += proposed_premium
+                change_str = _fmt_signed_money(change)
+                pct_str = _fmt_signed_pct(change / expiring_premium * 100)
             else:
-                change_str = "\u2014"
-                pct_str = "\u2014"
-                total_proposed += proposed_premium
+                change_str = pct_str = _DASH
             rows.append([display_name, carrier_name, exp_str, prop_str, change_str, pct_str, comm_str, rev_str, broker_str])
         elif is_included:
-            exp_str = "\u2014" if not expiring_premium else _safe_currency(expiring_premium)
-            rows.append([display_name, "Included in GL", exp_str, "Included", "\u2014", "\u2014", "\u2014", "\u2014", "\u2014"])
+            rows.append([display_name, "Included in GL", exp_str, "Included", _DASH, _DASH, _DASH, _DASH, _DASH])
         else:
-            exp_str = _safe_currency(expiring_premium) if expiring_premium else "\u2014"
             pending_coverages.append(display_name)
-            rows.append([display_name, carrier_name, exp_str, "Pending", "\u2014", "\u2014", comm_str, rev_str, broker_str])
+            rows.append([display_name, carrier_name, exp_str, "Pending", _DASH, _DASH, comm_str, rev_str, broker_str])
 
     # Total row
     total_change = total_proposed - total_expiring if total_expiring > 0 else 0
     total_pct = (total_change / total_expiring * 100) if total_expiring > 0 else 0
-    total_change_str = f"+${total_change:,.0f}" if total_change > 0 else f"-${abs(total_change):,.0f}" if total_change != 0 else "\u2014"
-    total_pct_str = f"+{total_pct:.1f}%" if total_change > 0 else f"{total_pct:.1f}%" if total_change != 0 else "\u2014"
+    total_change_str = _fmt_signed_money(total_change)
+    total_pct_str = _fmt_signed_pct(total_pct)
 
     rows.append([
         "TOTAL", "",
-        _safe_currency(total_expiring) if total_expiring else "\u2014",
-        _safe_currency(total_proposed) if total_proposed else "\u2014",
-        total_change_str, total_pct_str, "\u2014",
-        _safe_currency(total_commission_revenue) if total_commission_revenue else "\u2014", "\u2014",
+        _safe_currency(total_expiring) if total_expiring else _DASH,
+        _safe_currency(total_proposed) if total_proposed else _DASH,
+        total_change_str, total_pct_str, _DASH,
+        _safe_currency(total_commission_revenue) if total_commission_revenue else _DASH, _DASH,
     ])
 
     return rows, total_change, total_pct, pending_coverages
@@ -1940,39 +2436,32 @@ def build_premium_comparison_internal(by_coverage, parsed_policies):
 # MARKET ACTIVITY BUILDER
 # ══════════════════════════════════════════════════════════════════════════
 
-def build_market_activity(by_coverage):
+def build_market_activity(by_coverage, status_buckets=None, sorted_display=None):
     """Build market activity overview rows."""
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
     rows = []
-    sorted_coverages = sorted(by_coverage.keys(), key=_coverage_sort_key)
-
-    for ct in sorted_coverages:
+    for ct, display_name in sorted_display:
         policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
+        b = status_buckets[ct]
+        bound, quoted = b["bound"], b["quoted"]
 
         total_marketed = len(policies)
-        quotes_received = len([p for p in policies if p["status"] in ("Quoted", "Bound", "Proposed")])
-        proposed_count = len([p for p in policies if p["status"] in ("Bound", "Proposed")])
-
-        # Determine overall status
-        if any(p["status"] == "Bound" for p in policies):
-            overall_status = "Bound"
-        elif any(p["status"] == "Proposed" for p in policies):
-            overall_status = "Proposed"
-        elif any(p["status"] == "Quoted" for p in policies):
+        quotes_received = len(quoted) + len(bound)
+        proposed_count = len(bound)
+
+        # Determine overall status (Bound sorts ahead of Proposed)
+        if bound:
+            overall_status = bound[0]["status"]
+        elif quoted:
             overall_status = "Quoted"
         else:
             overall_status = "Pending"
 
-        # Check if included in another coverage
-        is_included = False
-        for p in policies:
-            comments = str(p.get("comments", "")).lower()
-            if "included" in comments:
-                is_included = True
-                break
-
-        if is_included:
-            rows.append([display_name, "—", "—", f"Included in GL", overall_status])
+        if b["included"]:
+            rows.append([display_name, _DASH, _DASH, f"Included in GL", overall_status])
         else:
             proposed_str = str(proposed_count) if proposed_count > 0 else "0"
             rows.append([display_name, str(total_marketed), str(quotes_received), proposed_str, overall_status])
@@ -1984,30 +2473,26 @@ def build_market_activity(by_coverage):
 # COVERAGE SUMMARY AT A GLANCE
 # ══════════════════════════════════════════════════════════════════════════
 
-def build_coverage_summary(by_coverage):
-    """Build coverage summary at a glance rows."""
-    rows = []
-    sorted_coverages = sorted(by_coverage.keys(), key=_coverage_sort_key)
-
-    for ct in sorted_coverages:
-        policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
+def _join_carriers(*groups):
+    """Comma-join the distinct carriers of one or more policy lists in order, or _DASH if none."""
+    carriers = dict.fromkeys(p["carrier"] for group in groups for p in group)
+    return ", ".join(carriers) if carriers else _DASH
 
-        expiring_carriers = [p["carrier"] for p in policies if p["status"] == "Incumbent"]
-        bound_carriers = [p["carrier"] for p in policies if p["status"] in ("Bound", "Proposed")]
-        quoted_carriers = [p["carrier"] for p in policies if p["status"] == "Quoted"]
-        pending_carriers = [p["carrier"] for p in policies if p["status"] in ("Market", "Submit", "Pending")]
 
-        # Check if included
-        is_included = any("included" in str(p.get("comments", "")).lower() for p in policies)
+def build_coverage_summary(by_coverage, status_buckets=None, sorted_display=None):
+    """Build coverage summary at a glance rows."""
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
+    rows = []
+    for ct, display_name in sorted_display:
+        b = status_buckets[ct]
 
-        exp_str = ", ".join(set(expiring_carriers)) if expiring_carriers else "—"
-        if is_included:
-            bound_str = "Included in GL"
-        else:
-            bound_str = ", ".join(set(bound_carriers)) if bound_carriers else "—"
-        quoted_str = ", ".join(set(quoted_carriers)) if quoted_carriers else "—"
-        pending_str = ", ".join(set(pending_carriers)) if pending_carriers else "—"
+        exp_str = _join_carriers(b["incumbent"])
+        bound_str = "Included in GL" if b["included"] else _join_carriers(b["bound"])
+        quoted_str = _join_carriers(b["quoted"])
+        pending_str = _join_carriers(b["awaiting"], b["pending"])
 
         rows.append([display_name, exp_str, bound_str, quoted_str, pending_str])
 
@@ -2018,75 +2503,24 @@ def build_coverage_summary(by_coverage):
 # MAIN DOCUMENT GENERATOR
 # ══════════════════════════════════════════════════════════════════════════
 
-def generate_marketing_update_docx(
-    opp_fields: dict,
-    parsed_policies: list,
-    by_coverage: dict,
-    client_name: str,
-    is_internal: bool = True,
-) -> str:
-    """
-    Generate the Marketing Update DOCX document.
-
-    Args:
-        opp_fields: Opportunity record fields (or empty dict)
-        parsed_policies: List of parsed policy dicts
-        by_coverage: Policies grouped by coverage type
-        client_name: Client/opportunity name
-        is_internal: If True, include commission, revenue, rates, broker info
-
-    Returns:
-        Path to the generated DOCX file.
-    """
-    doc = Document()
-
-    for section in doc.sections:
-        section.left_margin = Inches(0.6)
-        section.right_margin = Inches(0.6)
-        section.top_margin = Inches(1.2)
-        section.bottom_margin = Inches(0.6)
-
-    add_page_header(doc)
-
-    # ── Determine client info ──
-    opp_name = ""
-    effective_date = ""
-    corporate_name = ""
-    if opp_fields:
-        opp_name = opp_fields.get("Opportunity Name", "")
-        effective_date_raw = opp_fields.get("Effective Date", "")
-        if effective_date_raw:
-            try:
-                dt = datetime.strptime(str(effective_date_raw), "%Y-%m-%d")
-                effective_date = dt.strftime("%m/%d/%Y")
-            except (ValueError, TypeError):
-                effective_date = str(effective_date_raw)
-        corporate_name = opp_fields.get("Opportunity Corporate Name", "")
-        if not corporate_name:
-            cn = opp_fields.get("Corporate Name", "")
-            if isinstance(cn, list):
-                corporate_name = cn[0] if cn else ""
-            else:
-                corporate_name = str(cn) if cn else ""
+class _FilenameCharTable(dict):
+    """str.translate table keeping alphanumerics, space, underscore and hyphen; filled on first sight."""
 
-    display_name = corporate_name or client_name
-    version_label = "Internal" if is_internal else "Client"
+    def __missing__(self, code):
+        ch = chr(code)
+        keep = code if ch.isalnum() or ch in " _-" else None
+        self[code] = keep
+        return keep
 
-    # ════════════════════════════════════════════════════════════════
-    # PAGE 1: TITLE & PREMIUM COMPARISON
-    # ════════════════════════════════════════════════════════════════
 
-    add_section_header(doc, "Insurance Marketing Update")
+_FILENAME_CHARS = _FilenameCharTable()
 
-    add_formatted_paragraph(doc, f"Prepared for: {display_name}",
-                           size=13, color=CLASSIC_BLUE, bold=True, space_before=4, space_after=2)
-    if effective_date:
-        add_formatted_paragraph(doc, f"Effective Date: {effective_date}  |  Package Program",
-                               size=11, color=ELECTRIC_BLUE, bold=False, space_before=0, space_after=2)
-    add_formatted_paragraph(doc, f"Report Date: {datetime.now().strftime('%m/%d/%Y')}",
-                           size=10, color=CHARCOAL, bold=False, space_before=0, space_after=4)
 
-    add_divider(doc)
+def _add_policy_sections(doc, by_coverage, parsed_policies, is_internal):
+    """Premium comparison through Coverage Summary: every section driven by the policy data."""
+    # Coverage order and short labels, shared by every section below
+    sorted_display = _sorted_display(by_coverage)
+    status_buckets = bucket_by_status(by_coverage)
 
     # ── Premium Comparison ──
     add_subsection_header(doc, "Premium Comparison — Expiring vs. Proposed")
@@ -2094,15 +2528,15 @@ def generate_marketing_update_docx(
     add_callout_box(doc, "Premiums shown include applicable taxes and fees. "
                         "TRIA/Terrorism premiums are not included in totals.")
 
-    add_formatted_paragraph(doc, "", size=4, space_before=0, space_after=0)
+    add_spacer(doc, 4)
 
     if is_internal:
         premium_headers = ["Coverage", "Carrier", "Expiring", "Proposed", "$ Change", "% Change", "Comm", "Revenue", "Broker"]
-        premium_rows, total_change, total_pct, pending_coverages = build_premium_comparison_internal(by_coverage, parsed_policies)
+        premium_rows, total_change, total_pct, pending_coverages = build_premium_comparison_internal(by_coverage, parsed_policies, status_buckets, sorted_display)
         col_widths = [0.9, 1.1, 0.85, 0.85, 0.8, 0.65, 0.55, 0.7, 0.6]
     else:
         premium_headers = ["Coverage", "Carrier", "Expiring", "Proposed", "$ Change", "% Change"]
-        premium_rows, total_change, total_pct, pending_coverages = build_premium_comparison(by_coverage, parsed_policies)
+        premium_rows, total_change, total_pct, pending_coverages = build_premium_comparison(by_coverage, parsed_policies, status_buckets, sorted_display)
         col_widths = [1.2, 1.5, 1.1, 1.1, 1.1, 1.0]
 
     create_premium_summary_table(
@@ -2111,7 +2545,7 @@ def generate_marketing_update_docx(
         highlight_last_row=True,
     )
 
-    add_formatted_paragraph(doc, "", size=4, space_before=0, space_after=0)
+    add_spacer(doc, 4)
 
     # Summary notes
     notes = []
@@ -2144,7 +2578,7 @@ def generate_marketing_update_docx(
         size=10, color=CLASSIC_BLUE, space_before=2, space_after=8)
 
     activity_headers = ["Coverage", "Carriers Marketed", "Quotes Received", "Proposed", "Status"]
-    activity_rows = build_market_activity(by_coverage)
+    activity_rows = build_market_activity(by_coverage, status_buckets, sorted_display)
 
     create_premium_summary_table(
         doc, activity_headers, activity_rows,
@@ -2152,32 +2586,25 @@ def generate_marketing_update_docx(
     )
 
     # Key Highlights section - auto-generated from data
-    add_formatted_paragraph(doc, "", size=6, space_before=0, space_after=0)
+    add_spacer(doc, 6)
     add_subsection_header(doc, "Key Highlights & Recommendations")
 
-    highlights = _generate_highlights(by_coverage, parsed_policies)
+    highlights = _generate_highlights(by_coverage, parsed_policies, sorted_display, status_buckets)
     for title, description in highlights:
         hl_table = doc.add_table(rows=1, cols=1)
-        hl_cell = hl_table.rows[0].cells[0]
+        hl_cell = hl_table._cells[0]
         set_cell_shading(hl_cell, EGGSHELL_HEX)
         p_title = hl_cell.paragraphs[0]
-        p_title.paragraph_format.space_before = Pt(6)
-        p_title.paragraph_format.space_after = Pt(2)
-        p_title.paragraph_format.left_indent = Inches(0.1)
-        run_t = p_title.add_run(title)
-        run_t.font.size = Pt(10)
-        run_t.font.color.rgb = ELECTRIC_BLUE
-        run_t.font.bold = True
-        run_t.font.name = "Calibri"
+        p_title.paragraph_format.space_before = _PT[6]
+        p_title.paragraph_format.space_after = _PT[2]
+        p_title.paragraph_format.left_indent = _IN[0.1]
+        _apply_rpr(p_title.add_run(title), _RPR_EMPHASIS_10)
         p_desc = hl_cell.add_paragraph()
-        p_desc.paragraph_format.space_before = Pt(2)
-        p_desc.paragraph_format.space_after = Pt(6)
-        p_desc.paragraph_format.left_indent = Inches(0.1)
-        run_d = p_desc.add_run(description)
-        run_d.font.size = Pt(9)
-        run_d.font.color.rgb = CLASSIC_BLUE
-        run_d.font.name = "Calibri"
-        add_formatted_paragraph(doc, "", size=3, space_before=0, space_after=0)
+        p_desc.paragraph_format.space_before = _PT[2]
+        p_desc.paragraph_format.space_after = _PT[6]
+        p_desc.paragraph_format.left_indent = _IN[0.1]
+        _apply_rpr(p_desc.add_run(description), _RPR_DESC_9)
+        add_spacer(doc, 3)
 
     # ════════════════════════════════════════════════════════════════
     # CARRIER COMPARISON TABLES
@@ -2190,117 +2617,30 @@ def generate_marketing_update_docx(
     color_legend += "Expiring carriers shown in gray, proposed/bound in green, quoted in white, and pending in yellow."
     add_callout_box(doc, color_legend)
 
-    add_formatted_paragraph(doc, "", size=6, space_before=0, space_after=0)
-
-    sorted_coverages = sorted(by_coverage.keys(), key=_coverage_sort_key)
-    first_on_page = True
-
-    for ct in sorted_coverages:
-        policies = by_coverage[ct]
-        if not policies:
-            continue
-
-        display_title = COVERAGE_DISPLAY_NAMES.get(ct, ct)
-        short_title = COVERAGE_SHORT.get(ct, ct)
+    add_spacer(doc, 6)
 
-        # Build carrier data for comparison table
-        builder_func, metrics_func = COVERAGE_BUILDERS.get(ct, (_build_generic_carrier, _get_generic_metrics))
-
-        carriers_data = []
-
-        # For Property: use tower view if multiple incumbents
-        if ct == "Property":
-            tower = _build_property_tower(policies, is_internal=is_internal)
-            if tower:
-                carriers_data.append(tower)
-                # Add non-incumbent carriers individually
-                for p in policies:
-                    if p["status"] != "Incumbent":
-                        carrier_dict = builder_func(p, is_internal=is_internal)
-                        carriers_data.append(carrier_dict)
-            else:
-                for p in policies:
-                    carrier_dict = builder_func(p, is_internal=is_internal)
-                    carriers_data.append(carrier_dict)
-        # For Umbrella: use tower view if multiple incumbents (client version)
-        elif ct == "Umbrella":
-            tower = _build_umbrella_tower(policies, is_internal=is_internal)
-            if tower and not is_internal:
-                # Client version: show combined tower
-                carriers_data.append(tower)
-                for p in policies:
-                    if p["status"] != "Incumbent":
-                        carrier_dict = builder_func(p, is_internal=is_internal)
-                        carriers_data.append(carrier_dict)
-            else:
-                # Internal version: show individual carriers for full detail
-                for p in policies:
-                    carrier_dict = builder_func(p, is_internal=is_internal)
-                    carriers_data.append(carrier_dict)
-        else:
-            for p in policies:
-                carrier_dict = builder_func(p, is_internal=is_internal)
-                carriers_data.append(carrier_dict)
+    lazy_tables = [
+        LazyCoverageTable(ct, by_coverage[ct], is_internal)
+        for ct, _ in sorted_display
+    ]
+    # Page break management - pack sections until the estimated row budget is spent
+    rows_on_page = COMPARISON_PAGE_HEADER_ROWS
 
-        if not carriers_data:
+    for lazy_table in lazy_tables:
+        if not lazy_table.carriers_data:
             continue
 
-        # Separate declined carriers from the main table
-        active_carriers = [c for c in carriers_data if c["status"] not in ("Declined", "Blocked", "Lost")]
-        declined_carriers = [c for c in carriers_data if c["status"] in ("Declined", "Blocked", "Lost")]
-
-        # Use active carriers for the main table (or all if none are active)
-        table_carriers = active_carriers if active_carriers else carriers_data
-        metrics = metrics_func(table_carriers, is_internal=is_internal)
-
-        # Page break management - avoid too many tables on one page
-        if not first_on_page and len(table_carriers) > 2:
+        rows = lazy_table.row_estimate
+        if rows_on_page > 0 and rows_on_page + rows > COMPARISON_ROWS_PER_PAGE:
             add_page_break(doc)
-            first_on_page = True
-
-        add_subsection_header(doc, display_title)
-        create_carrier_comparison_table(doc, short_title, metrics, table_carriers)
-
-        # Show declined carriers as a clean note below the table
-        if declined_carriers:
-            p_label = doc.add_paragraph()
-            p_label.paragraph_format.space_before = Pt(4)
-            p_label.paragraph_format.space_after = Pt(1)
-            p_label.paragraph_format.left_indent = Inches(0.1)
-            run_label = p_label.add_run("Declined Markets:")
-            run_label.font.size = Pt(8)
-            run_label.font.color.rgb = RGBColor(0x88, 0x88, 0x88)
-            run_label.font.bold = True
-            run_label.font.italic = True
-            run_label.font.name = "Calibri"
-
-            for dc in declined_carriers:
-                name = dc["name"]
-                notes = dc.get("notes", "")
-                broker = dc.get("values", {}).get("Broker", "")
-                # Build line: "Carrier Name (via Broker) — reason"
-                line = name
-                if broker:
-                    line += f" (via {broker})"
-                if notes and notes != "Declined to quote":
-                    short_notes = notes[:100] + "..." if len(notes) > 100 else notes
-                    line += f" \u2014 {short_notes}"
-                p_dc = doc.add_paragraph()
-                p_dc.paragraph_format.space_before = Pt(0)
-                p_dc.paragraph_format.space_after = Pt(1)
-                p_dc.paragraph_format.left_indent = Inches(0.25)
-                run_dc = p_dc.add_run(f"\u2022 {line}")
-                run_dc.font.size = Pt(7.5)
-                run_dc.font.color.rgb = RGBColor(0x88, 0x88, 0x88)
-                run_dc.font.italic = True
-                run_dc.font.name = "Calibri"
+            rows_on_page = 0
 
-        add_formatted_paragraph(doc, "", size=8, space_before=0, space_after=0)
-        first_on_page = False
+        lazy_table.render(doc)
+        rows_on_page += rows
 
     # Internal detail pages (Property Tower Detail, Umbrella Tower Detail, GL Detail)
     if is_internal:
-        _add_internal_detail_pages(doc, by_coverage, parsed_policies)
+        _add_internal_detail_pages(doc, by_coverage, parsed_policies, status_buckets)
 
     # ════════════════════════════════════════════════════════════════
     # NEXT STEPS & COVERAGE SUMMARY
@@ -2309,89 +2649,125 @@ def generate_marketing_update_docx(
     add_page_break(doc)
     add_subsection_header(doc, "Next Steps")
 
-    next_steps = _generate_next_steps(by_coverage, parsed_policies)
+    next_steps = _generate_next_steps(by_coverage, parsed_policies, sorted_display, status_buckets)
     for i, step in enumerate(next_steps):
         p = doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(4)
-        p.paragraph_format.space_after = Pt(4)
-        p.paragraph_format.line_spacing = Pt(14)
-        p.paragraph_format.left_indent = Inches(0.3)
-        p.paragraph_format.first_line_indent = Inches(-0.3)
-        run_num = p.add_run(f"{i+1}.  ")
-        run_num.font.size = Pt(10)
-        run_num.font.color.rgb = ELECTRIC_BLUE
-        run_num.font.bold = True
-        run_num.font.name = "Calibri"
-        run_text = p.add_run(step)
-        run_text.font.size = Pt(10)
-        run_text.font.color.rgb = CLASSIC_BLUE
-        run_text.font.name = "Calibri"
+        p.paragraph_format.space_before = _PT[4]
+        p.paragraph_format.space_after = _PT[4]
+        p.paragraph_format.line_spacing = _PT[14]
+        p.paragraph_format.left_indent = _IN[0.3]
+        p.paragraph_format.first_line_indent = _IN[-0.3]
+        _apply_rpr(p.add_run(f"{i+1}.  "), _RPR_EMPHASIS_10)
+        _apply_rpr(p.add_run(step), _RPR_STEP_10)
 
     # Coverage Summary at a Glance
-    add_formatted_paragraph(doc, "", size=8, space_before=0, space_after=0)
+    add_spacer(doc, 8)
     add_subsection_header(doc, "Coverage Summary at a Glance")
 
     summary_headers = ["Coverage", "Expiring", "Proposed / Bound", "Quoted", "Pending"]
-    summary_rows = build_coverage_summary(by_coverage)
+    summary_rows = build_coverage_summary(by_coverage, status_buckets, sorted_display)
 
     create_premium_summary_table(
         doc, summary_headers, summary_rows,
         col_widths=[1.5, 1.5, 1.5, 1.5, 1.5],
     )
 
+
+def generate_marketing_update_docx(
+    opp_fields: dict,
+    parsed_policies: list,
+    by_coverage: dict,
+    client_name: str,
+    is_internal: bool = True,
+) -> str:
+    """
+    Generate the Marketing Update DOCX document.
+
+    Args:
+        opp_fields: Opportunity record fields (or empty dict)
+        parsed_policies: List of parsed policy dicts
+        by_coverage: Policies grouped by coverage type
+        client_name: Client/opportunity name
+        is_internal: If True, include commission, revenue, rates, broker info
+
+    Returns:
+        Path to the generated DOCX file.
+    """
+    doc = _new_document()
+
+    for section in doc.sections:
+        section.left_margin = _IN[0.6]
+        section.right_margin = _IN[0.6]
+        section.top_margin = _IN[1.2]
+        section.bottom_margin = _IN[0.6]
+
+    add_page_header(doc)
+
+    # ── Determine client info ──
+    opp_name = ""
+    effective_date = ""
+    corporate_name = ""
+    if opp_fields:
+        opp_name = opp_fields.get("Opportunity Name", "")
+        effective_date_raw = opp_fields.get("Effective Date", "")
+        if effective_date_raw:
+            try:
+                dt = datetime.strptime(str(effective_date_raw), "%Y-%m-%d")
+                effective_date = dt.strftime("%m/%d/%Y")
+            except (ValueError, TypeError):
+                effective_date = str(effective_date_raw)
+        corporate_name = opp_fields.get("Opportunity Corporate Name", "")
+        if not corporate_name:
+            cn = opp_fields.get("Corporate Name", "")
+            if isinstance(cn, list):
+                corporate_name = cn[0] if cn else ""
+            else:
+                corporate_name = str(cn) if cn else ""
+
+    display_name = corporate_name or client_name
+    version_label = "Internal" if is_internal else "Client"
+
+    # ════════════════════════════════════════════════════════════════
+    # PAGE 1: TITLE & PREMIUM COMPARISON
+    # ════════════════════════════════════════════════════════════════
+
+    add_section_header(doc, "Insurance Marketing Update")
+
+    add_formatted_paragraph(doc, f"Prepared for: {display_name}",
+                           size=13, color=CLASSIC_BLUE, bold=True, space_before=4, space_after=2)
+    if effective_date:
+        add_formatted_paragraph(doc, f"Effective Date: {effective_date}  |  Package Program",
+                               size=11, color=ELECTRIC_BLUE, bold=False, space_before=0, space_after=2)
+    add_formatted_paragraph(doc, f"Report Date: {datetime.now().strftime('%m/%d/%Y')}",
+                           size=10, color=CHARCOAL, bold=False, space_before=0, space_after=4)
+
+    add_divider(doc)
+
+    if any(by_coverage.values()):
+        _add_policy_sections(doc, by_coverage, parsed_policies, is_internal)
+    else:
+        # Nothing to compare: skip the empty tables and go straight to contacts
+        add_callout_box(doc, "No policy data is available for this client yet.")
+
     # ── Contact & Disclaimer ──
-    add_formatted_paragraph(doc, "", size=8, space_before=0, space_after=0)
+    add_spacer(doc, 8)
     add_divider(doc)
 
     add_formatted_paragraph(doc, "Your HUB Hotel Franchise Team",
                            size=12, color=ELECTRIC_BLUE, bold=True, space_before=4, space_after=6)
 
-    contact_table = doc.add_table(rows=3, cols=2)
-    contact_table.alignment = WD_TABLE_ALIGNMENT.LEFT
-    remove_table_borders(contact_table)
-
-    contacts = [
-        ("Stefan Burkey", "Hotel Franchise Practice Leader  |  stefan.burkey@hubinternational.com"),
-        ("Maureen Harvey", "Account Executive  |  maureen.harvey@hubinternational.com"),
-        ("Sheena Callazo", "Claims Advocate  |  sheena.callazo@hubinternational.com"),
-    ]
+    add_contact_table(doc)
 
-    for r_idx, (name, role) in enumerate(contacts):
-        cell_name = contact_table.rows[r_idx].cells[0]
-        cell_name.text = ""
-        p_n = cell_name.paragraphs[0]
-        p_n.paragraph_format.space_before = Pt(2)
-        p_n.paragraph_format.space_after = Pt(2)
-        run_n = p_n.add_run(name)
-        run_n.font.size = Pt(9)
-        run_n.font.color.rgb = CLASSIC_BLUE
-        run_n.font.bold = True
-        run_n.font.name = "Calibri"
-        set_cell_width(cell_name, 1.8)
-        remove_cell_borders(cell_name)
-
-        cell_role = contact_table.rows[r_idx].cells[1]
-        cell_role.text = ""
-        p_r = cell_role.paragraphs[0]
-        p_r.paragraph_format.space_before = Pt(2)
-        p_r.paragraph_format.space_after = Pt(2)
-        run_r = p_r.add_run(role)
-        run_r.font.size = Pt(9)
-        run_r.font.color.rgb = CHARCOAL
-        run_r.font.name = "Calibri"
-        set_cell_width(cell_role, 5.7)
-        remove_cell_borders(cell_role)
-
-    add_formatted_paragraph(doc, "", size=6, space_before=0, space_after=0)
-    add_callout_box(doc, "This marketing update is for informational purposes only and does not constitute a binder of insurance. "
-                        "Actual coverage terms, conditions, and exclusions are governed by the policies as issued. "
-                        "Please review all policies carefully upon receipt.", size=8)
+    add_spacer(doc, 6)
+    add_disclaimer(doc)
 
     # ── Save ──
     version_suffix = "Internal" if is_internal else "Client"
-    safe_name = "".join(c for c in display_name if c.isalnum() or c in " _-").strip().replace(" ", "_")
+    safe_name = display_name.translate(_FILENAME_CHARS).strip().replace(" ", "_")
     filename = f"Marketing_Update_{safe_name}_{version_suffix}.docx"
     output_path = os.path.join(tempfile.gettempdir(), filename)
+    # The whole tree is held until save; a marketing update is a handful of pages
+    # (one comparison table per coverage line), so a streaming writer isn't needed.
     doc.save(output_path)
     logger.info(f"Marketing Update DOCX saved to {output_path}")
     return output_path
@@ -2401,53 +2777,49 @@ def generate_marketing_update_docx(
 # AUTO-GENERATED HIGHLIGHTS & NEXT STEPS
 # ══════════════════════════════════════════════════════════════════════════
 
-def _generate_highlights(by_coverage, parsed_policies):
+def _generate_highlights(by_coverage, parsed_policies, sorted_display=None, status_buckets=None):
     """Auto-generate key highlights from the policy data."""
     highlights = []
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
+    pending = []
 
-    for ct in sorted(by_coverage.keys(), key=_coverage_sort_key):
-        policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
-
-        expiring = [p for p in policies if p["status"] == "Incumbent"]
-        bound = [p for p in policies if p["status"] in ("Bound", "Proposed")]
-        quoted = [p for p in policies if p["status"] == "Quoted"]
-
-        if bound and expiring:
-            exp_prem = sum(p["premium_tx"] for p in expiring)
-            bound_prem = sum(p["premium_tx"] for p in bound)
-            if exp_prem > 0 and bound_prem > 0:
-                change = bound_prem - exp_prem
-                pct = (change / exp_prem) * 100
-                carrier = bound[0]["carrier"]
-                if change < 0:
-                    highlights.append((
-                        f"{display_name} Premium Reduction",
-                        f"{carrier} renewal at {_safe_currency(bound_prem)}, "
-                        f"a {abs(pct):.1f}% decrease from expiring premium of {_safe_currency(exp_prem)}."
-                    ))
-                elif change > 0:
-                    highlights.append((
-                        f"{display_name} Premium Increase",
-                        f"{carrier} renewal at {_safe_currency(bound_prem)}, "
-                        f"a {pct:.1f}% increase from expiring premium of {_safe_currency(exp_prem)}."
-                    ))
+    for ct, display_name in sorted_display:
+        b = status_buckets[ct]
+        bound, quoted = b["bound"], b["quoted"]
+        exp_prem = b["incumbent_premium"]
+        bound_prem = b["bound_premium"]
+
+        if not (bound or quoted):
+            pending.append(display_name)
+
+        if exp_prem > 0 and bound_prem > 0:
+            change = bound_prem - exp_prem
+            pct = (change / exp_prem) * 100
+            carrier = bound[0]["carrier"]
+            if change < 0:
+                highlights.append((
+                    f"{display_name} Premium Reduction",
+                    f"{carrier} renewal at {_safe_currency(bound_prem)}, "
+                    f"a {abs(pct):.1f}% decrease from expiring premium of {_safe_currency(exp_prem)}."
+                ))
+            elif change > 0:
+                highlights.append((
+                    f"{display_name} Premium Increase",
+                    f"{carrier} renewal at {_safe_currency(bound_prem)}, "
+                    f"a {pct:.1f}% increase from expiring premium of {_safe_currency(exp_prem)}."
+                ))
 
         # Note competitive quotes
         if quoted and len(quoted) >= 2:
             carriers = [q["carrier"] for q in quoted]
             highlights.append((
                 f"{display_name} — Multiple Quotes",
-                f"Received competitive quotes from {', '.join(set(carriers))}."
+                f"Received competitive quotes from {', '.join(dict.fromkeys(carriers))}."
             ))
 
-    # Check for pending coverages
-    pending = []
-    for ct in by_coverage:
-        policies = by_coverage[ct]
-        if not any(p["status"] in ("Bound", "Proposed", "Quoted") for p in policies):
-            pending.append(COVERAGE_SHORT.get(ct, ct))
-
     if pending:
         highlights.append((
             "Pending Coverages",
@@ -2463,33 +2835,30 @@ def _generate_highlights(by_coverage, parsed_policies):
     return highlights
 
 
-def _generate_next_steps(by_coverage, parsed_policies):
+def _generate_next_steps(by_coverage, parsed_policies, sorted_display=None, status_buckets=None):
     """Auto-generate next steps from the policy data."""
     steps = []
+    if sorted_display is None:
+        sorted_display = _sorted_display(by_coverage)
+    if status_buckets is None:
+        status_buckets = bucket_by_status(by_coverage)
 
-    # Check for pending/market status policies
-    for ct in sorted(by_coverage.keys(), key=_coverage_sort_key):
-        policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
+    # Awaiting-quote steps come first, then coverages quoted but not yet proposed
+    finalizing = []
+    for ct, display_name in sorted_display:
+        b = status_buckets[ct]
+        pending = b["awaiting"]
 
-        pending = [p for p in policies if p["status"] in ("Market", "Submit")]
         if pending:
-            carriers = list(set(p["carrier"] for p in pending))
+            carriers = list(dict.fromkeys(p["carrier"] for p in pending))
             steps.append(
                 f"Awaiting {display_name} quotes from {', '.join(carriers)}."
             )
-
-    # Check for quoted but not yet proposed
-    for ct in sorted(by_coverage.keys(), key=_coverage_sort_key):
-        policies = by_coverage[ct]
-        display_name = COVERAGE_SHORT.get(ct, ct)
-
-        quoted = [p for p in policies if p["status"] == "Quoted"]
-        bound = [p for p in policies if p["status"] in ("Bound", "Proposed")]
-        if quoted and not bound:
-            steps.append(
+        if b["quoted"] and not b["bound"]:
+            finalizing.append(
                 f"Finalizing {display_name} recommendation based on received quotes."
             )
+    steps.extend(finalizing)
 
     steps.append(
         "Full insurance proposal with all coverage sections, forms, and endorsements "
@@ -2503,6 +2872,32 @@ def _generate_next_steps(by_coverage, parsed_policies):
 # MAIN ENTRY POINT
 # ══════════════════════════════════════════════════════════════════════════
 
+# Parsed client data is reused for a few minutes so the Internal and Client
+# renders of the same account don't repeat the Airtable fetch and parse.
+CLIENT_DATA_TTL_SECONDS = 300
+CLIENT_DATA_CACHE_MAX = 64
+_client_data_cache = {}
+
+
+def _get_cached_client_data(client_name):
+    """Return (opp_fields, parsed_policies, by_coverage) if cached and fresh, else None."""
+    entry = _client_data_cache.get(client_name)
+    if entry is None:
+        return None
+    stored_at, data = entry
+    if time.monotonic() - stored_at > CLIENT_DATA_TTL_SECONDS:
+        _client_data_cache.pop(client_name, None)
+        return None
+    return data
+
+
+def _store_client_data(client_name, opp_fields, parsed_policies, by_coverage):
+    if len(_client_data_cache) >= CLIENT_DATA_CACHE_MAX:
+        # Drop the oldest entry (dicts keep insertion order)
+        _client_data_cache.pop(next(iter(_client_data_cache)), None)
+    _client_data_cache[client_name] = (time.monotonic(), (opp_fields, parsed_policies, by_coverage))
+
+
 async def generate_marketing_update(client_name: str, is_internal: bool = True) -> str:
     """
     Main entry point: generate a Marketing Update DOCX for a client.
@@ -2516,16 +2911,24 @@ async def generate_marketing_update(client_name: str, is_internal: bool = True)
     """
     logger.info(f"generate_marketing_update called for: '{client_name}' (internal={is_internal})")
 
-    opp_fields, policies = await resolve_client_data(client_name)
+    cached = _get_cached_client_data(client_name)
+    if cached:
+        opp_fields, parsed, by_coverage = cached
+        logger.info(f"Reusing parsed policies for '{client_name}' from cache")
+    else:
+        opp_fields, policies = await resolve_client_data(client_name)
 
-    if not policies:
-        return f"No policies found for '{client_name}'."
+        if not policies:
+            return f"No policies found for '{client_name}'."
 
-    parsed = parse_policies(policies)
-    by_coverage = group_by_coverage(parsed)
+        parsed = parse_policies(policies)
+        # Raw Airtable records aren't needed past parsing; don't hold them through DOCX rendering
+        del policies
+        by_coverage = group_by_coverage(parsed)
 
-    if not opp_fields:
-        opp_fields = {}
+        if not opp_fields:
+            opp_fields = {}
+        _store_client_data(client_name, opp_fields, parsed, by_coverage)
 
     try:
         output_path = generate_marketing_update_docx(